@@ -0,0 +1,89 @@
+import sqlite3
+import time
+import os
+
+
+ANALYSIS_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "pynguin-experiments",
+    "analysis_cache.sqlite",
+)
+
+ANALYSIS_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+
+def open_analysis_cache(cache_path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    connection = sqlite3.connect(cache_path, timeout=60)
+
+    connection.execute("PRAGMA journal_mode=DELETE")
+
+    with connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                signature TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+
+    return connection
+
+
+def get_cache_entry(
+    connection: sqlite3.Connection, key: str, signature: str
+) -> bytes | None:
+    row = connection.execute(
+        "SELECT value FROM entries WHERE key = ? AND signature = ?",
+        (key, signature),
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    with connection:
+        connection.execute(
+            "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+        )
+
+    return row[0]
+
+
+def insert_cache_entry(
+    connection: sqlite3.Connection,
+    key: str,
+    signature: str,
+    value: bytes,
+    max_size: int,
+) -> None:
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (key, signature, value, len(value), time.time()),
+        )
+        connection.execute(
+            """
+            DELETE FROM entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (
+                        ORDER BY last_access DESC, key
+                    ) AS total_size
+                    FROM entries
+                )
+                WHERE total_size > ?
+            )
+            """,
+            (max_size,),
+        )
+
+
+def clear_analysis_cache(connection: sqlite3.Connection) -> None:
+    with connection:
+        connection.execute("DELETE FROM entries")
+
+    connection.execute("VACUUM")
@@ -0,0 +1,256 @@
+from experiment import monitor_process, NANOSECONDS_IN_SECOND, BYTES_IN_MEBIBYTE
+from generate_results import SYNTHETIC_RESULTS_NAME
+from results_store import RESULTS_STORE_NAME
+from typing import NamedTuple
+import subprocess
+import statistics
+import tempfile
+import argparse
+import json
+import sys
+import os
+
+
+SCRIPTS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+STAGE_TIMEOUT = 3600
+
+MINIMUM_TIME_REGRESSION = 0.5
+
+MINIMUM_MEMORY_REGRESSION = 16
+
+
+class BenchmarkStage(NamedTuple):
+    name: str
+    script: str
+    args: list[str]
+    clear_results_store: bool
+
+
+def get_benchmark_stages(
+    synthetic_results_path: str, synthetic_results: dict
+) -> list[BenchmarkStage]:
+    results_path = os.path.join(synthetic_results_path, "results")
+
+    experiment_paths = [
+        os.path.join(results_path, experiment_name)
+        for experiment_name in synthetic_results["experiment_names"]
+    ]
+
+    first_experiment_path = experiment_paths[0]
+    second_experiment_path = experiment_paths[min(1, len(experiment_paths) - 1)]
+
+    aggregate_args = [
+        "--modules-csv-path",
+        os.path.join(synthetic_results_path, "modules.csv"),
+        "--project-path",
+        os.path.join(synthetic_results_path, "project"),
+        "--results-path",
+        results_path,
+        "--nb-runs",
+        str(synthetic_results["nb_runs"]),
+        "--aggregate-only",
+    ]
+
+    return [
+        BenchmarkStage("aggregate_cold", "experiment.py", aggregate_args, True),
+        BenchmarkStage("aggregate_warm", "experiment.py", aggregate_args, False),
+        BenchmarkStage(
+            "compare_cold",
+            "compare.py",
+            ["--clear-cache", first_experiment_path, second_experiment_path],
+            False,
+        ),
+        BenchmarkStage(
+            "compare_warm",
+            "compare.py",
+            [first_experiment_path, second_experiment_path],
+            False,
+        ),
+        BenchmarkStage(
+            "line_compare",
+            "line_compare.py",
+            [first_experiment_path, second_experiment_path],
+            False,
+        ),
+        BenchmarkStage(
+            "latex_table_cold",
+            "latex_table.py",
+            ["--clear-cache", *experiment_paths],
+            False,
+        ),
+        BenchmarkStage("latex_table_warm", "latex_table.py", experiment_paths, False),
+        BenchmarkStage(
+            "line_hit_frequency",
+            "line_hit_frequency.py",
+            ["--no-interactive", "--mode", "heatmap", *experiment_paths],
+            False,
+        ),
+    ]
+
+
+def run_stage(stage: BenchmarkStage, results_path: str, work_path: str) -> dict:
+    if stage.clear_results_store:
+        results_store_path = os.path.join(results_path, RESULTS_STORE_NAME)
+        if os.path.exists(results_store_path):
+            os.remove(results_store_path)
+
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(SCRIPTS_PATH, stage.script), *stage.args],
+        cwd=work_path,
+        env={
+            **os.environ,
+            "XDG_CACHE_HOME": os.path.join(work_path, "cache"),
+            "MPLBACKEND": "Agg",
+        },
+        stdout=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    return_code, telemetry = monitor_process(process, STAGE_TIMEOUT, 0, None)
+
+    if return_code != 0:
+        raise RuntimeError(
+            f'Stage "{stage.name}" failed with return code {return_code}'
+        )
+
+    return {
+        "wall_time": telemetry["wall_time"],
+        "cpu_time": telemetry["user_time"] + telemetry["system_time"],
+        "peak_rss": telemetry["peak_rss"],
+    }
+
+
+def run_benchmark(
+    synthetic_results_path: str, synthetic_results: dict, repeat: int
+) -> dict[str, dict]:
+    results_path = os.path.join(synthetic_results_path, "results")
+
+    stage_results = {}
+    with tempfile.TemporaryDirectory() as work_path:
+        for stage in get_benchmark_stages(synthetic_results_path, synthetic_results):
+            print(f"{stage.name} : Running {repeat} times")
+
+            measurements = [
+                run_stage(stage, results_path, work_path) for _ in range(repeat)
+            ]
+
+            stage_results[stage.name] = {
+                "wall_time": statistics.median(
+                    measurement["wall_time"] for measurement in measurements
+                ),
+                "cpu_time": statistics.median(
+                    measurement["cpu_time"] for measurement in measurements
+                ),
+                "peak_rss": max(
+                    measurement["peak_rss"] for measurement in measurements
+                ),
+            }
+
+    return stage_results
+
+
+def compare_with_baseline(
+    stage_results: dict[str, dict], baseline_results: dict[str, dict], tolerance: float
+) -> bool:
+    regression = False
+
+    print(
+        f'{"Stage":<20} {"Wall time (s)":>15} {"Baseline":>10} {"Peak RSS (MiB)":>15} {"Baseline":>10}  Status'
+    )
+
+    for stage_name, results in stage_results.items():
+        wall_time = results["wall_time"] / NANOSECONDS_IN_SECOND
+        peak_rss = results["peak_rss"] / BYTES_IN_MEBIBYTE
+
+        baseline = baseline_results.get(stage_name)
+
+        if baseline is None:
+            print(
+                f"{stage_name:<20} {wall_time:>15.2f} {'-':>10} {peak_rss:>15.1f} {'-':>10}  New"
+            )
+            continue
+
+        baseline_wall_time = baseline["wall_time"] / NANOSECONDS_IN_SECOND
+        baseline_peak_rss = baseline["peak_rss"] / BYTES_IN_MEBIBYTE
+
+        stage_regressions = [
+            name
+            for name, value, baseline_value, minimum_regression in (
+                ("time", wall_time, baseline_wall_time, MINIMUM_TIME_REGRESSION),
+                ("memory", peak_rss, baseline_peak_rss, MINIMUM_MEMORY_REGRESSION),
+            )
+            if value > baseline_value * (1 + tolerance)
+            and value - baseline_value > minimum_regression
+        ]
+
+        if stage_regressions:
+            regression = True
+            status = f'Regression ({", ".join(stage_regressions)})'
+        else:
+            status = "Ok"
+
+        print(
+            f"{stage_name:<20} {wall_time:>15.2f} {baseline_wall_time:>10.2f} {peak_rss:>15.1f} {baseline_peak_rss:>10.1f}  {status}"
+        )
+
+    return regression
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("synthetic_results_path")
+    parser.add_argument("--baseline-path", default="benchmark_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output-path", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+
+    args = parser.parse_args()
+
+    with open(os.path.join(args.synthetic_results_path, SYNTHETIC_RESULTS_NAME)) as f:
+        synthetic_results = json.load(f)
+
+    benchmark = {
+        "synthetic_results": {
+            key: value
+            for key, value in synthetic_results.items()
+            if key != "experiment_names"
+        },
+        "stages": run_benchmark(
+            os.path.abspath(args.synthetic_results_path),
+            synthetic_results,
+            args.repeat,
+        ),
+    }
+
+    if args.output_path is not None:
+        with open(args.output_path, "w") as f:
+            json.dump(benchmark, f, indent=4)
+
+    if args.save_baseline:
+        with open(args.baseline_path, "w") as f:
+            json.dump(benchmark, f, indent=4)
+
+        compare_with_baseline(benchmark["stages"], {}, args.tolerance)
+
+        print(f"Baseline saved to {args.baseline_path}")
+        return
+
+    if not os.path.exists(args.baseline_path):
+        compare_with_baseline(benchmark["stages"], {}, args.tolerance)
+        return
+
+    with open(args.baseline_path, "r") as f:
+        baseline = json.load(f)
+
+    if baseline["synthetic_results"] != benchmark["synthetic_results"]:
+        print("The baseline was recorded on a different synthetic results tree")
+        sys.exit(1)
+
+    if compare_with_baseline(benchmark["stages"], baseline["stages"], args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
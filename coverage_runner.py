@@ -0,0 +1,258 @@
+import subprocess
+import tempfile
+import argparse
+import json
+import sys
+import os
+
+
+TEST_TIMINGS_NAME = "test_timings.json"
+
+
+def reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss() -> int | None:
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return None
+
+
+class TestRecorder:
+    def __init__(self, test_ids: set[str] | None) -> None:
+        self.test_ids = test_ids
+        self.tests: dict[str, dict] = {}
+
+    def pytest_collection_modifyitems(self, items: list) -> None:
+        if self.test_ids is not None:
+            items[:] = [item for item in items if item.nodeid in self.test_ids]
+
+    def pytest_collection_finish(self, session) -> None:
+        for item in session.items:
+            self.tests[item.nodeid] = {
+                "duration": 0.0,
+                "peak_rss": None,
+                "outcome": "passed",
+            }
+
+    def pytest_runtest_logstart(self, nodeid: str) -> None:
+        reset_peak_rss()
+
+    def pytest_runtest_logreport(self, report) -> None:
+        test = self.tests.setdefault(
+            report.nodeid, {"duration": 0.0, "peak_rss": None, "outcome": "passed"}
+        )
+
+        test["duration"] += report.duration
+
+        if report.failed:
+            test["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped:
+            test["outcome"] = "skipped"
+
+        if report.when == "teardown":
+            test["peak_rss"] = get_peak_rss()
+
+
+def write_json(path: str, data) -> None:
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary_path, "w") as f:
+        json.dump(data, f)
+
+    os.replace(temporary_path, path)
+
+
+def write_json_report(measurement, output_path: str) -> None:
+    temporary_path = f"{output_path}.{os.getpid()}.tmp"
+    measurement.json_report(outfile=temporary_path, pretty_print=True)
+    os.replace(temporary_path, output_path)
+
+
+def run_tests(
+    module_path: str,
+    test_file: str,
+    test_ids: set[str] | None,
+    data_file: str | None,
+    output_path: str | None,
+) -> dict[str, dict]:
+    import coverage
+    import pytest
+
+    recorder = TestRecorder(test_ids)
+
+    if output_path is None and data_file is None:
+        pytest.main([test_file], plugins=[recorder])
+        return recorder.tests
+
+    measurement = coverage.Coverage(
+        data_file=data_file, branch=True, include=[module_path]
+    )
+
+    measurement.start()
+
+    try:
+        pytest.main([test_file], plugins=[recorder])
+    finally:
+        measurement.stop()
+
+    if output_path is None:
+        measurement.save()
+    else:
+        write_json_report(measurement, output_path)
+
+    return recorder.tests
+
+
+def collect_test_ids(test_file: str) -> list[str]:
+    import pytest
+
+    recorder = TestRecorder(None)
+
+    pytest.main(["--collect-only", "-q", test_file], plugins=[recorder])
+
+    return list(recorder.tests)
+
+
+def run_workers(
+    module_path: str,
+    test_file: str,
+    chunks: list[list[str]],
+    temporary_path: str,
+    replay_index: int,
+    measure: bool,
+) -> tuple[dict[str, dict], list[str]]:
+    processes = []
+    for i, chunk in enumerate(chunks):
+        prefix = os.path.join(temporary_path, f"{replay_index}_{i}")
+
+        with open(f"{prefix}.ids", "w") as f:
+            json.dump(chunk, f)
+
+        worker_argv = [
+            sys.executable,
+            os.path.abspath(__file__),
+            module_path,
+            test_file,
+            "--test-ids-path",
+            f"{prefix}.ids",
+            "--timings-path",
+            f"{prefix}.timings",
+        ]
+
+        if measure:
+            worker_argv.extend(("--data-file", f"{prefix}.coverage"))
+
+        processes.append((prefix, subprocess.Popen(worker_argv)))
+
+    tests = {}
+    data_files = []
+    for prefix, process in processes:
+        process.wait()
+
+        try:
+            with open(f"{prefix}.timings", "r") as f:
+                tests.update(json.load(f))
+        except (FileNotFoundError, ValueError):
+            pass
+
+        if os.path.exists(f"{prefix}.coverage"):
+            data_files.append(f"{prefix}.coverage")
+
+    return tests, data_files
+
+
+def replay_tests(
+    module_path: str, test_file: str, output_path: str, jobs: int, repeats: int
+) -> list[dict[str, dict]]:
+    import coverage
+
+    test_ids = collect_test_ids(test_file)
+
+    chunks = [chunk for chunk in (test_ids[i::jobs] for i in range(jobs)) if chunk]
+
+    replays = []
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as temporary_path:
+        for replay_index in range(repeats):
+            tests, data_files = run_workers(
+                module_path,
+                test_file,
+                chunks,
+                temporary_path,
+                replay_index,
+                replay_index == 0,
+            )
+
+            replays.append(tests)
+
+            if replay_index == 0 and data_files:
+                measurement = coverage.Coverage(
+                    data_file=os.path.join(temporary_path, "coverage"),
+                    branch=True,
+                    include=[module_path],
+                )
+                measurement.combine(data_files)
+                write_json_report(measurement, output_path)
+
+    return replays
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("module_path")
+    parser.add_argument("test_file")
+    parser.add_argument("--output-path", default="coverage.json")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--test-ids-path", default=None)
+    parser.add_argument("--timings-path", default=None)
+    parser.add_argument("--data-file", default=None)
+
+    args = parser.parse_args()
+
+    if sys.version_info >= (3, 12):
+        os.environ.setdefault("COVERAGE_CORE", "sysmon")
+
+    sys.path.insert(0, os.getcwd())
+
+    if args.test_ids_path is not None:
+        with open(args.test_ids_path, "r") as f:
+            test_ids = set(json.load(f))
+
+        tests = run_tests(
+            args.module_path, args.test_file, test_ids, args.data_file, None
+        )
+
+        write_json(args.timings_path, tests)
+
+        return
+
+    if args.jobs <= 1 and args.repeats <= 1:
+        replays = [
+            run_tests(args.module_path, args.test_file, None, None, args.output_path)
+        ]
+    else:
+        replays = replay_tests(
+            args.module_path,
+            args.test_file,
+            args.output_path,
+            max(1, args.jobs),
+            max(1, args.repeats),
+        )
+
+    write_json(TEST_TIMINGS_NAME, {"replays": replays})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import numpy as np
+import os
+
+
+COVERAGE_TIMELINES_NAME = "coverage_timelines.npy"
+
+COVERAGE_THRESHOLDS = (0.5, 0.8, 0.9)
+
+
+def create_coverage_timelines(timelines: list[list[float]]) -> np.ndarray:
+    nb_intervals = max((len(timeline) for timeline in timelines), default=0)
+
+    coverage_timelines = np.zeros((len(timelines), nb_intervals), dtype=np.float64)
+    for i, timeline in enumerate(timelines):
+        if timeline:
+            coverage_timelines[i, : len(timeline)] = timeline
+            coverage_timelines[i, len(timeline) :] = timeline[-1]
+
+    return coverage_timelines
+
+
+def load_coverage_timelines(experiment_path: str) -> np.ndarray:
+    return np.load(os.path.join(experiment_path, COVERAGE_TIMELINES_NAME))
+
+
+def get_coverage_aucs(coverage_timelines: np.ndarray) -> np.ndarray:
+    nb_intervals = coverage_timelines.shape[1]
+
+    if nb_intervals == 0:
+        return np.zeros(len(coverage_timelines))
+
+    return (
+        coverage_timelines.sum(axis=1) - coverage_timelines[:, -1] / 2
+    ) / nb_intervals
+
+
+def get_times_to_coverage(
+    coverage_timelines: np.ndarray, threshold: float, interval: float
+) -> np.ndarray:
+    reached = coverage_timelines >= threshold
+
+    return np.where(
+        reached.any(axis=1), (reached.argmax(axis=1) + 1) * interval, np.inf
+    )
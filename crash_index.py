@@ -0,0 +1,138 @@
+from experiment import read_return_code, get_available_cpus
+from crash_signatures import scan_run_crashes
+from results_store import open_results_store, get_run_records, insert_run_record
+from results_store import insert_run_crashes, get_crash_index
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from contextlib import closing
+import argparse
+import csv
+import os
+
+
+def scan_run(run_path: str) -> list[dict]:
+    try:
+        return_code = read_return_code(run_path)
+    except FileNotFoundError:
+        return_code = None
+
+    return scan_run_crashes(run_path, return_code)
+
+
+def get_experiment_names(results_path: str) -> list[str]:
+    return sorted(
+        name
+        for name in os.listdir(results_path)
+        if not name.startswith(".")
+        and os.path.isdir(os.path.join(results_path, name))
+    )
+
+
+def get_run_indexes(experiment_path: str) -> list[int]:
+    return sorted(
+        int(name)
+        for name in os.listdir(experiment_path)
+        if name.isdigit() and os.path.isdir(os.path.join(experiment_path, name))
+    )
+
+
+def update_crash_index(
+    results_path: str, experiment_names: list[str], rescan: bool, jobs: int
+) -> None:
+    with closing(open_results_store(results_path)) as results_store:
+        runs = []
+        run_records = {}
+        for experiment_name in experiment_names:
+            run_records[experiment_name] = get_run_records(
+                results_store, experiment_name
+            )
+
+            experiment_path = os.path.join(results_path, experiment_name)
+
+            for run_index in get_run_indexes(experiment_path):
+                record = run_records[experiment_name].get(run_index)
+
+                if rescan or record is None or "crashes" not in record:
+                    runs.append((experiment_name, run_index))
+
+        print(f"Scanning {len(runs)} runs")
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            all_crashes = executor.map(
+                scan_run,
+                [
+                    os.path.join(results_path, experiment_name, str(run_index))
+                    for experiment_name, run_index in runs
+                ],
+                chunksize=16,
+            )
+
+            for (experiment_name, run_index), crashes in zip(runs, all_crashes):
+                insert_run_crashes(results_store, experiment_name, run_index, crashes)
+
+                record = run_records[experiment_name].get(run_index)
+
+                if record is not None:
+                    record["crashes"] = crashes
+                    insert_run_record(results_store, experiment_name, run_index, record)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--results-path", default="results")
+    parser.add_argument("--jobs", type=int, default=0)
+    parser.add_argument("--rescan", action="store_true")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("experiments", nargs="*")
+
+    args = parser.parse_args()
+
+    if args.experiments:
+        experiment_names = args.experiments
+    else:
+        experiment_names = get_experiment_names(args.results_path)
+
+    jobs = args.jobs if args.jobs > 0 else get_available_cpus()
+
+    update_crash_index(args.results_path, experiment_names, args.rescan, jobs)
+
+    with closing(open_results_store(args.results_path)) as results_store:
+        crash_index = [
+            row for row in get_crash_index(results_store) if row[3] in experiment_names
+        ]
+
+    signatures = {}
+    signature_runs = defaultdict(dict)
+    unique_crash_counts = defaultdict(int)
+    for signature, kind, crash_site, experiment_name, nb_runs in crash_index:
+        signatures[signature] = (kind, crash_site)
+        signature_runs[signature][experiment_name] = nb_runs
+        unique_crash_counts[experiment_name] += 1
+
+    for experiment_name in experiment_names:
+        print(
+            f"{experiment_name:<30}: {unique_crash_counts[experiment_name]} unique crashes"
+        )
+
+    print()
+    print(f'{"Signature":<14}{"Kind":<6}{"Runs":>6}{"Experiments":>13}  Crash site')
+
+    for signature, experiment_runs in sorted(
+        signature_runs.items(), key=lambda item: -sum(item[1].values())
+    ):
+        kind, crash_site = signatures[signature]
+        print(
+            f"{signature[:12]:<14}{kind:<6}{sum(experiment_runs.values()):>6}{len(experiment_runs):>13}  {crash_site}"
+        )
+
+    if args.output is not None:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ("signature", "kind", "crash_site", "experiment_name", "nb_runs")
+            )
+            writer.writerows(crash_index)
+
+
+if __name__ == "__main__":
+    main()
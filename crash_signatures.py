@@ -0,0 +1,181 @@
+from run_logs import open_log
+from collections import deque
+import hashlib
+import signal
+import json
+import ast
+import re
+import os
+
+
+TRACEBACK_TAIL_SIZE = 200
+
+TRACEBACK_STARTS = ("Traceback (most recent call last):", "Fatal Python error:")
+
+TRACEBACK_FRAME = re.compile(r'File "(?P<file>[^"]+)", line \d+,? in (?P<function>\S+)')
+
+
+class CrashTestNormalizer(ast.NodeTransformer):
+    def __init__(self) -> None:
+        self.names: dict[str, str] = {}
+        self.modules: dict[str, str] = {}
+
+    def get_name(self, name: str) -> str:
+        if name in self.modules:
+            return self.modules[name]
+
+        if name not in self.names:
+            self.names[name] = f"var_{len(self.names)}"
+
+        return self.names[name]
+
+    def visit_alias(self, node: ast.alias) -> ast.alias:
+        if node.asname is None:
+            root_name = node.name.split(".")[0]
+            self.modules[root_name] = root_name
+        else:
+            self.modules[node.asname] = node.name
+            node.asname = None
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        node.name = "test"
+        self.generic_visit(node)
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        node.id = self.get_name(node.id)
+        return node
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:
+        node.value = type(node.value).__name__
+        return node
+
+
+def get_signature(*parts: object) -> str:
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def get_crash_site(tree: ast.Module) -> str:
+    functions = [node for node in tree.body if isinstance(node, ast.FunctionDef)]
+
+    if not functions or not functions[-1].body:
+        return ""
+
+    for node in ast.walk(functions[-1].body[-1]):
+        if isinstance(node, ast.Call):
+            return ast.unparse(node.func)
+
+    return ast.unparse(functions[-1].body[-1])
+
+
+def get_crash_test_signature(source_code: str) -> tuple[str, str]:
+    try:
+        tree = ast.parse(source_code)
+    except SyntaxError:
+        return get_signature("test", " ".join(source_code.split())), ""
+
+    tree = CrashTestNormalizer().visit(tree)
+
+    return get_signature("test", ast.unparse(tree)), get_crash_site(tree)
+
+
+def get_crash_test_files(run_path: str) -> dict[str, str]:
+    crash_test_files = {}
+    for filename in sorted(os.listdir(run_path)):
+        if not filename.startswith("crash_test_") or not filename.endswith(".py"):
+            continue
+
+        crash_name = filename.removesuffix(".py").removesuffix("_minimized")
+
+        if crash_name not in crash_test_files or filename.endswith("_minimized.py"):
+            crash_test_files[crash_name] = filename
+
+    return crash_test_files
+
+
+def get_traceback(run_path: str) -> tuple[str, list[str]]:
+    try:
+        with open_log(run_path, "stderr.log") as f:
+            lines = deque(f, maxlen=TRACEBACK_TAIL_SIZE)
+    except FileNotFoundError:
+        return "", []
+
+    lines = [line.rstrip("\n") for line in lines]
+
+    starts = [
+        i for i, line in enumerate(lines) if line.lstrip().startswith(TRACEBACK_STARTS)
+    ]
+
+    if not starts:
+        return "", []
+
+    traceback_lines = lines[starts[-1] :]
+
+    if traceback_lines[0].startswith("Fatal Python error:"):
+        error = traceback_lines[0].removeprefix("Fatal Python error:").strip()
+    else:
+        error = next(
+            (
+                line.split(":")[0]
+                for line in reversed(traceback_lines)
+                if line and not line[0].isspace()
+            ),
+            "",
+        )
+
+    frames = [
+        f'{os.path.basename(match["file"])}:{match["function"]}'
+        for match in map(TRACEBACK_FRAME.search, traceback_lines)
+        if match is not None
+    ]
+
+    if traceback_lines[0].startswith("Fatal Python error:"):
+        frames.reverse()
+
+    return error, frames
+
+
+def get_run_crash(run_path: str, return_code: int | None) -> dict | None:
+    if return_code is None or return_code == 0:
+        return None
+
+    if return_code < 0:
+        try:
+            termination = signal.Signals(-return_code).name
+        except ValueError:
+            termination = f"signal {-return_code}"
+    else:
+        termination = f"exit code {return_code}"
+
+    error, frames = get_traceback(run_path)
+
+    return {
+        "source": "run",
+        "kind": "run",
+        "signature": get_signature("run", termination, error, frames),
+        "crash_site": frames[-1] if frames else termination,
+    }
+
+
+def scan_run_crashes(run_path: str, return_code: int | None) -> list[dict]:
+    crashes = []
+    for filename in get_crash_test_files(run_path).values():
+        with open(os.path.join(run_path, filename), "r", errors="replace") as f:
+            signature, crash_site = get_crash_test_signature(f.read())
+
+        crashes.append(
+            {
+                "source": filename,
+                "kind": "test",
+                "signature": signature,
+                "crash_site": crash_site,
+            }
+        )
+
+    run_crash = get_run_crash(run_path, return_code)
+
+    if run_crash is not None:
+        crashes.append(run_crash)
+
+    return crashes
@@ -1,145 +1,2071 @@
 import subprocess
 import os
-import random
 import argparse
 import time
 import csv
 import json
-import inspect
-import importlib
+import importlib.machinery
+import hashlib
 import ast
+import sys
+import fcntl
+import shutil
+import sysconfig
+import socket
+import signal
+import tempfile
+import math
+import sqlite3
+import threading
+import asyncio
+from typing import Callable, NamedTuple, TextIO
+from contextlib import closing
+from datetime import timedelta
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from work_queue import (
+    open_work_queue,
+    enqueue_experiment,
+    acquire_work_item,
+    renew_lease,
+    complete_work_item,
+    release_work_item,
+    count_remaining_work_items,
+    get_queued_experiments,
+)
+from run_logs import LogPipe, create_log
+from crash_signatures import scan_run_crashes, get_traceback
+from resource_limits import parse_resource_limits, get_rlimits, create_cgroup
+from resource_limits import get_preexec_fn, get_limit_hit, remove_cgroup
+from resource_limits import get_cgroup_parent_path
+from profiles import PROFILERS, get_cprofile_argv, start_py_spy, stop_py_spy
+from profiles import write_run_profile, write_experiment_profile
+from coverage_runner import TEST_TIMINGS_NAME
+from scheduler import RunEstimate, get_run_estimate, find_next_task, simulate_schedule
+from results_store import (
+    RESULTS_STORE_NAME,
+    open_results_store,
+    insert_run_record,
+    get_run_records,
+    delete_run_record,
+    insert_run_crashes,
+    insert_executable_lines,
+    get_executable_lines,
+)
 
 
 NANOSECONDS_IN_SECOND = 1_000_000_000
 
+BYTES_IN_MEBIBYTE = 1024 * 1024
+
+SAMPLING_INTERVAL = 1.0
+
+MEMORY_TIMELINE_SIZE = 256
+
+TIMELINE_INTERVAL = 1
+
+SLOW_TEST_COUNT = 10
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+COVERAGE_RUNNER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "coverage_runner.py"
+)
+
+FORKSERVER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "forkserver.py"
+)
+
+
+class Experiment(NamedTuple):
+    module_name: str
+    experiment_name: str
+    pynguin_commit: str
+    maximum_search_time: int
+    timeout: int
+    pynguin_args: list[str]
+    nb_runs: int
+    resource_limits: dict[str, int]
+
+
+class RunSettings(NamedTuple):
+    pynguin_path: str
+    environments_path: str
+    project_path: str
+    results_path: str
+    forkserver: bool
+    log_compression: str
+    log_max_size: int | None
+    kill_grace_period: int
+    profiler: str | None
+    replay_jobs: int
+    replay_repeats: int
+
+
+class StageJobs(NamedTuple):
+    search: int
+    coverage: int
+    extraction: int
+
+
+class Schedule(NamedTuple):
+    estimates: dict[str, RunEstimate]
+    memory_budget: int | None
+
+
+class Run(NamedTuple):
+    results_path: str
+    experiment_name: str
+    index: int
+    module_name: str
+    module_path: str
+    pynguin_executable: str
+    project_path: str
+    run_path: str
+    maximum_search_time: int
+    timeout: int
+    seed: int
+    pynguin_args: list[str]
+    forkserver: bool
+    log_compression: str
+    log_max_size: int | None
+    kill_grace_period: int
+    resource_limits: dict[str, int]
+    profiler: str | None
+    replay_jobs: int
+    replay_repeats: int
+
+
+PROCESS_CHILDREN_FILES = os.path.exists(f"/proc/self/task/{os.getpid()}/children")
+
+PROCESS_CHILDREN: dict[int, list[int]] = {}
+
+PROCESS_CHILDREN_TIME = 0
+
+PROCESS_CHILDREN_LOCK = threading.Lock()
+
+
+def scan_process_children() -> dict[int, list[int]]:
+    children: dict[int, list[int]] = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+
+        try:
+            with open(f"/proc/{name}/stat", "r") as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            continue
+
+        parent_pid = int(stat[stat.rindex(")") + 2 :].split()[1])
+        children.setdefault(parent_pid, []).append(int(name))
+
+    return children
+
+
+def get_process_children() -> dict[int, list[int]]:
+    global PROCESS_CHILDREN, PROCESS_CHILDREN_TIME
+
+    with PROCESS_CHILDREN_LOCK:
+        if (
+            time.monotonic_ns() - PROCESS_CHILDREN_TIME
+            >= SAMPLING_INTERVAL * NANOSECONDS_IN_SECOND / 2
+        ):
+            PROCESS_CHILDREN = scan_process_children()
+            PROCESS_CHILDREN_TIME = time.monotonic_ns()
+
+        return PROCESS_CHILDREN
+
+
+def get_task_children(pid: int) -> list[int]:
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", "r") as children_file:
+                children.extend(map(int, children_file.read().split()))
+    except OSError:
+        pass
+
+    return children
+
+
+def get_process_tree(pid: int) -> list[int]:
+    if PROCESS_CHILDREN_FILES:
+        get_children = get_task_children
+    else:
+        process_children = get_process_children()
+        get_children = lambda process_pid: process_children.get(process_pid, ())
+
+    process_tree = []
+    pids = [pid]
+    while pids:
+        current_pid = pids.pop()
+        process_tree.append(current_pid)
+        pids.extend(get_children(current_pid))
+
+    return process_tree
+
+
+def get_process_tree_rss(pid: int) -> int:
+    rss = 0
+    for process_pid in get_process_tree(pid):
+        try:
+            with open(f"/proc/{process_pid}/statm", "r") as statm_file:
+                rss += int(statm_file.read().split()[1]) * PAGE_SIZE
+        except (OSError, IndexError, ValueError):
+            continue
+
+    return rss
+
+
+def is_process_alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", "r") as stat_file:
+            stat = stat_file.read()
+    except OSError:
+        return False
+
+    return stat[stat.rindex(")") + 2] != "Z"
+
+
+class ForkedProcess:
+    def __init__(
+        self,
+        socket_path: str,
+        argv: list[str],
+        cwd: str,
+        stdout_file: TextIO | LogPipe,
+        stderr_file: TextIO | LogPipe,
+        cgroup_path: str | None,
+        rlimits: list[tuple[int, tuple[int, int]]],
+    ) -> None:
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.connection.connect(socket_path)
+
+        request = {
+            "argv": argv,
+            "cwd": cwd,
+            "cgroup_path": cgroup_path,
+            "rlimits": rlimits,
+        }
+
+        socket.send_fds(
+            self.connection,
+            [json.dumps(request).encode()],
+            [stdout_file.fileno(), stderr_file.fileno()],
+        )
+
+        self.reader = self.connection.makefile("r")
+
+        try:
+            reply = self.reader.readline()
+
+            if not reply:
+                raise ConnectionError("The forkserver closed the connection")
+
+            self.pid = json.loads(reply)["pid"]
+        except BaseException:
+            self.reader.close()
+            self.connection.close()
+            raise
+
+    def wait(self) -> tuple[int, float, float, int]:
+        try:
+            result = json.loads(self.reader.readline())
+        except (OSError, ValueError):
+            while is_process_alive(self.pid):
+                time.sleep(SAMPLING_INTERVAL)
+
+            return 1, 0.0, 0.0, 0
+        finally:
+            self.reader.close()
+            self.connection.close()
+
+        return (
+            result["return_code"],
+            result["user_time"],
+            result["system_time"],
+            result["max_rss"],
+        )
+
+
+PROCESS_GROUPS: set[int] = set()
+
+PROCESS_GROUPS_LOCK = threading.RLock()
+
+INTERRUPTED = threading.Event()
+
+
+def signal_process_group(pid: int, signal_number: int) -> None:
+    try:
+        os.killpg(pid, signal_number)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def signal_process_groups(signal_number: int) -> None:
+    with PROCESS_GROUPS_LOCK:
+        for pid in PROCESS_GROUPS:
+            signal_process_group(pid, signal_number)
+
+
+def interrupt_process_groups(signal_number: int, frame) -> None:
+    INTERRUPTED.set()
+    signal_process_groups(signal.SIGINT)
+    signal.default_int_handler(signal_number, frame)
+
+
+def is_run_cancelled(cancel_event: threading.Event | None) -> bool:
+    return INTERRUPTED.is_set() or (cancel_event is not None and cancel_event.is_set())
+
+
+def terminate_process_group(
+    pid: int, kill_grace_period: int, stop_event: threading.Event
+) -> None:
+    signal_process_group(pid, signal.SIGTERM)
+
+    if not stop_event.wait(kill_grace_period):
+        signal_process_group(pid, signal.SIGKILL)
+
+
+FORKSERVERS: dict[tuple[str, str], tuple[subprocess.Popen, str]] = {}
+
+FORKSERVERS_LOCK = threading.Lock()
+
+
+def get_forkserver(pynguin_executable: str, module_name: str, project_path: str) -> str:
+    key = (pynguin_executable, module_name)
+
+    with FORKSERVERS_LOCK:
+        if key in FORKSERVERS:
+            process, socket_path = FORKSERVERS[key]
+
+            if process.poll() is None:
+                return socket_path
+
+            print(
+                f'The forkserver for "{module_name}" exited with {process.returncode}, restarting it'
+            )
+
+            shutil.rmtree(os.path.dirname(socket_path), ignore_errors=True)
+            del FORKSERVERS[key]
+
+        socket_path = os.path.join(tempfile.mkdtemp(), "forkserver.sock")
+
+        print(f'Starting a forkserver for "{module_name}" with {pynguin_executable}')
+
+        process = subprocess.Popen(
+            [
+                os.path.join(os.path.dirname(pynguin_executable), "python"),
+                FORKSERVER_PATH,
+                socket_path,
+                module_name,
+                project_path,
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+        if process.stdout.readline().strip() != "ready":
+            process.kill()
+            process.wait()
+            raise RuntimeError(f'The forkserver for "{module_name}" failed to start')
+
+        FORKSERVERS[key] = (process, socket_path)
+
+        return socket_path
+
+
+def stop_forkservers() -> None:
+    with FORKSERVERS_LOCK:
+        for process, socket_path in FORKSERVERS.values():
+            process.terminate()
+            process.wait()
+            shutil.rmtree(os.path.dirname(socket_path), ignore_errors=True)
+
+        FORKSERVERS.clear()
+
+
+def wait_process(
+    process: subprocess.Popen | ForkedProcess,
+) -> tuple[int, float, float, int]:
+    if isinstance(process, ForkedProcess):
+        return process.wait()
+
+    _, status, rusage = os.wait4(process.pid, 0)
+
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    return process.returncode, rusage.ru_utime, rusage.ru_stime, rusage.ru_maxrss
+
+
+def sample_process(
+    process: subprocess.Popen | ForkedProcess,
+    start_time: int,
+    timeout: int,
+    kill_grace_period: int,
+    stop_event: threading.Event,
+    cancel_event: threading.Event | None,
+    usage: dict,
+) -> None:
+    timeline_step = SAMPLING_INTERVAL
+    timeline_rss = 0
+    next_timeline_time = 0.0
+    while not stop_event.wait(SAMPLING_INTERVAL):
+        if cancel_event is not None and cancel_event.is_set():
+            signal_process_group(process.pid, signal.SIGKILL)
+            return
+
+        elapsed_time = (time.monotonic_ns() - start_time) / NANOSECONDS_IN_SECOND
+
+        if elapsed_time > timeout:
+            usage["timed_out"] = True
+            terminate_process_group(process.pid, kill_grace_period, stop_event)
+            return
+
+        rss = get_process_tree_rss(process.pid)
+        usage["peak_rss"] = max(usage["peak_rss"], rss)
+        timeline_rss = max(timeline_rss, rss)
+
+        if elapsed_time < next_timeline_time:
+            continue
+
+        memory_timeline = usage["memory_timeline"]
+        memory_timeline.append((round(elapsed_time, 3), timeline_rss))
+        timeline_rss = 0
+        next_timeline_time = elapsed_time + timeline_step
+
+        if len(memory_timeline) >= MEMORY_TIMELINE_SIZE:
+            usage["memory_timeline"] = [
+                (
+                    memory_timeline[i][0],
+                    max(rss for _, rss in memory_timeline[i : i + 2]),
+                )
+                for i in range(0, len(memory_timeline), 2)
+            ]
+            timeline_step *= 2
+
+
+def monitor_process(
+    process: subprocess.Popen | ForkedProcess,
+    timeout: int,
+    kill_grace_period: int,
+    cancel_event: threading.Event | None,
+) -> tuple[int | None, dict]:
+    start_time = time.monotonic_ns()
+
+    with PROCESS_GROUPS_LOCK:
+        PROCESS_GROUPS.add(process.pid)
+
+    usage = {"timed_out": False, "peak_rss": 0, "memory_timeline": []}
+
+    stop_event = threading.Event()
+
+    sampler = threading.Thread(
+        target=sample_process,
+        args=(
+            process,
+            start_time,
+            timeout,
+            kill_grace_period,
+            stop_event,
+            cancel_event,
+            usage,
+        ),
+        daemon=True,
+    )
+    sampler.start()
+
+    try:
+        exit_code, user_time, system_time, max_rss = wait_process(process)
+    finally:
+        stop_event.set()
+        sampler.join()
+
+        signal_process_group(process.pid, signal.SIGKILL)
+
+        with PROCESS_GROUPS_LOCK:
+            PROCESS_GROUPS.discard(process.pid)
+
+    wall_time = time.monotonic_ns() - start_time
+
+    if usage["timed_out"]:
+        return_code = None
+    else:
+        return_code = exit_code
+
+    telemetry = {
+        "wall_time": wall_time,
+        "user_time": user_time,
+        "system_time": system_time,
+        "peak_rss": max(usage["peak_rss"], max_rss * 1024),
+        "memory_timeline": usage["memory_timeline"],
+    }
+
+    return return_code, telemetry
+
 
 def run_pynguin(
+    pynguin_executable: str,
     module_name: str,
     project_path: str,
     run_path: str,
     maximum_search_time: int,
     timeout: int,
     seed: int,
+    forkserver_path: str | None,
+    log_compression: str,
+    log_max_size: int | None,
+    kill_grace_period: int,
+    resource_limits: dict[str, int],
+    profiler: str | None,
+    cancel_event: threading.Event | None,
     *pynguin_args: str,
 ) -> int | None:
-    os.makedirs(run_path, exist_ok=True)
+    os.makedirs(run_path, exist_ok=True)
+
+    formatted_pynguin_args = (arg.format(run_path=run_path) for arg in pynguin_args)
+
+    with open(f"{run_path}/seed", "w") as seed_file:
+        seed_file.write(f"{seed}")
+
+    with (
+        create_log(
+            run_path, "stdout.log", log_compression, log_max_size
+        ) as stdout_file,
+        create_log(
+            run_path, "stderr.log", log_compression, log_max_size
+        ) as stderr_file,
+    ):
+        pynguin_argv = [
+            "--module-name",
+            module_name,
+            "--project-path",
+            project_path,
+            "--output-path",
+            run_path,
+            "--report-dir",
+            run_path,
+            "--maximum-search-time",
+            str(maximum_search_time),
+            "--seed",
+            str(seed),
+            "--timeline-interval",
+            str(TIMELINE_INTERVAL * NANOSECONDS_IN_SECOND),
+            "--output-variables",
+            "TargetModule",
+            "AlgorithmIterations",
+            "Coverage",
+            "TotalTime",
+            "SearchTime",
+            "LineNos",
+            "MutationScore",
+            "CoverageTimeline",
+            "-v",
+            *formatted_pynguin_args,
+        ]
+
+        if profiler == "cprofile":
+            profiler_argv = get_cprofile_argv(
+                os.path.join(os.path.dirname(pynguin_executable), "python"), run_path
+            )
+        else:
+            profiler_argv = []
+
+        cgroup_path = create_cgroup(resource_limits, "pynguin")
+        rlimits = get_rlimits(resource_limits, cgroup_path is not None)
+
+        process = None
+
+        if forkserver_path is not None:
+            try:
+                process = ForkedProcess(
+                    forkserver_path,
+                    pynguin_argv,
+                    os.getcwd(),
+                    stdout_file,
+                    stderr_file,
+                    cgroup_path,
+                    rlimits,
+                )
+            except (OSError, ValueError):
+                print(
+                    f'The forkserver for "{module_name}" failed, starting Pynguin directly'
+                )
+
+        if process is None:
+            process = subprocess.Popen(
+                [*profiler_argv, pynguin_executable, *pynguin_argv],
+                stdout=stdout_file,
+                stderr=stderr_file,
+                start_new_session=True,
+                preexec_fn=get_preexec_fn(cgroup_path, rlimits),
+            )
+
+        if profiler == "py-spy":
+            profiler_process = start_py_spy(process.pid, run_path)
+        else:
+            profiler_process = None
+
+        return_code, telemetry = monitor_process(
+            process, timeout, kill_grace_period, cancel_event
+        )
+
+        stop_py_spy(profiler_process)
+
+    if cancel_event is not None and cancel_event.is_set():
+        remove_cgroup(cgroup_path)
+        return None
+
+    if resource_limits:
+        limit_hit = get_limit_hit(
+            resource_limits,
+            cgroup_path,
+            return_code,
+            telemetry["user_time"] + telemetry["system_time"],
+            get_traceback(run_path)[0],
+        )
+
+        remove_cgroup(cgroup_path)
+
+        if limit_hit is not None:
+            with open(f"{run_path}/limit_hit", "w") as limit_hit_file:
+                limit_hit_file.write(limit_hit)
+
+    with open(f"{run_path}/telemetry.json", "w") as telemetry_file:
+        json.dump(telemetry, telemetry_file)
+
+    with open(f"{run_path}/return_code", "w") as info_file:
+        info_file.write(f"{return_code}")
+
+    return return_code
+
+
+def run_coverage(
+    python_executable: str,
+    run_path: str,
+    module_path: str,
+    resource_limits: dict[str, int],
+    replay_jobs: int,
+    replay_repeats: int,
+) -> int | None:
+    try:
+        (test_file,) = filter(
+            lambda name: name.startswith("test_") and name.endswith(".py"),
+            os.listdir(run_path),
+        )
+    except ValueError:
+        return None
+
+    start_time = time.perf_counter_ns()
+
+    cgroup_path = create_cgroup(resource_limits, "coverage")
+
+    process = subprocess.Popen(
+        [
+            python_executable,
+            COVERAGE_RUNNER_PATH,
+            module_path,
+            test_file,
+            "--jobs",
+            str(replay_jobs),
+            "--repeats",
+            str(replay_repeats),
+        ],
+        cwd=run_path,
+        stdout=subprocess.DEVNULL,
+        preexec_fn=get_preexec_fn(
+            cgroup_path, get_rlimits(resource_limits, cgroup_path is not None)
+        ),
+    )
+
+    try:
+        process.wait()
+    finally:
+        remove_cgroup(cgroup_path)
+
+    coverage_time = time.perf_counter_ns() - start_time
+
+    with open(f"{run_path}/coverage_time", "w") as coverage_time_file:
+        coverage_time_file.write(f"{coverage_time}")
+
+    return coverage_time
+
+
+def mark_stage_done(run_path: str, stage: str) -> None:
+    marker_path = os.path.join(run_path, f"{stage}_done")
+    temporary_marker_path = f"{marker_path}.tmp"
+
+    with open(temporary_marker_path, "w") as marker_file:
+        marker_file.write(f"{time.time_ns()}")
+        marker_file.flush()
+        os.fsync(marker_file.fileno())
+
+    os.replace(temporary_marker_path, marker_path)
+
+
+def is_stage_done(run_path: str, stage: str) -> bool:
+    return os.path.exists(os.path.join(run_path, f"{stage}_done"))
+
+
+def read_return_code(run_path: str) -> int | None:
+    with open(os.path.join(run_path, "return_code"), "r") as f:
+        try:
+            return int(f.read())
+        except ValueError:
+            return None
+
+
+def read_seed(run_path: str, default_seed: int) -> int:
+    try:
+        with open(os.path.join(run_path, "seed"), "r") as f:
+            return int(f.read())
+    except (FileNotFoundError, ValueError):
+        return default_seed
+
+
+def parse_return_code(return_code: str) -> int | None:
+    if return_code in ("timeout", "null", "None"):
+        return None
+
+    return int(return_code)
+
+
+def execute_search_stage(run: Run, cancel_event: threading.Event | None) -> int | None:
+    if is_stage_done(run.run_path, "pynguin"):
+        return_code = read_return_code(run.run_path)
+    else:
+        if run.forkserver:
+            forkserver_path = get_forkserver(
+                run.pynguin_executable, run.module_name, run.project_path
+            )
+        else:
+            forkserver_path = None
+
+        return_code = run_pynguin(
+            run.pynguin_executable,
+            run.module_name,
+            run.project_path,
+            run.run_path,
+            run.maximum_search_time,
+            run.timeout,
+            run.seed,
+            forkserver_path,
+            run.log_compression,
+            run.log_max_size,
+            run.kill_grace_period,
+            run.resource_limits,
+            run.profiler,
+            cancel_event,
+            *run.pynguin_args,
+        )
+
+        if not is_run_cancelled(cancel_event):
+            mark_stage_done(run.run_path, "pynguin")
+
+    return return_code
+
+
+def execute_coverage_stage(
+    run: Run, return_code: int | None, cancel_event: threading.Event | None
+) -> None:
+    if is_stage_done(run.run_path, "coverage") or is_run_cancelled(cancel_event):
+        return
+
+    if return_code == 0 or return_code is None:
+        run_coverage(
+            os.path.join(os.path.dirname(run.pynguin_executable), "python"),
+            run.run_path,
+            run.module_path,
+            run.resource_limits,
+            run.replay_jobs,
+            run.replay_repeats,
+        )
+
+    if not is_run_cancelled(cancel_event):
+        mark_stage_done(run.run_path, "coverage")
+
+
+def execute_extraction_stage(run: Run) -> dict:
+    write_run_profile(run.run_path)
+
+    record = parse_run(run.run_path, run.maximum_search_time, run.timeout)
+
+    with closing(open_results_store(run.results_path)) as results_store:
+        insert_run_record(results_store, run.experiment_name, run.index, record)
+        insert_run_crashes(
+            results_store, run.experiment_name, run.index, record["crashes"]
+        )
+
+    return record
+
+
+def execute_run(run: Run, cancel_event: threading.Event | None) -> int | None:
+    return_code = execute_search_stage(run, cancel_event)
+
+    if is_run_cancelled(cancel_event):
+        return return_code
+
+    execute_coverage_stage(run, return_code, cancel_event)
+
+    if is_run_cancelled(cancel_event):
+        return return_code
+
+    execute_extraction_stage(run)
+
+    return return_code
+
+
+def get_available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_available_memory() -> int | None:
+    available_memories = []
+
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available_memories.append(int(line.split()[1]) * 1024)
+    except FileNotFoundError:
+        pass
+
+    try:
+        with (
+            open("/sys/fs/cgroup/memory.max", "r") as memory_max_file,
+            open("/sys/fs/cgroup/memory.current", "r") as memory_current_file,
+        ):
+            memory_max = memory_max_file.read().strip()
+            memory_current = int(memory_current_file.read())
+
+        if memory_max != "max":
+            available_memories.append(max(0, int(memory_max) - memory_current))
+    except (FileNotFoundError, ValueError):
+        pass
+
+    if not available_memories:
+        return None
+
+    return min(available_memories)
+
+
+def get_default_jobs(memory_per_job: int) -> int:
+    available_cpus = get_available_cpus()
+    available_memory = get_available_memory()
+
+    if available_memory is None:
+        return available_cpus
+
+    return max(1, min(available_cpus, available_memory // memory_per_job))
+
+
+def get_run_estimates(
+    experiments: list[Experiment], history_paths: list[str], default_peak_rss: int
+) -> dict[str, RunEstimate]:
+    records = {experiment.experiment_name: [] for experiment in experiments}
+    for history_path in history_paths:
+        if not os.path.exists(os.path.join(history_path, RESULTS_STORE_NAME)):
+            continue
+
+        with closing(open_results_store(history_path)) as results_store:
+            for experiment_name, experiment_records in records.items():
+                experiment_records.extend(
+                    get_run_records(results_store, experiment_name).values()
+                )
+
+    estimates = {}
+    for experiment in experiments:
+        if "memory" in experiment.resource_limits:
+            memory_limit = experiment.resource_limits["memory"] * BYTES_IN_MEBIBYTE
+        else:
+            memory_limit = None
+
+        estimates[experiment.experiment_name] = get_run_estimate(
+            records[experiment.experiment_name],
+            experiment.timeout,
+            default_peak_rss,
+            memory_limit,
+        )
+
+    return estimates
+
+
+async def execute_pipeline(
+    runs: list[Run],
+    stage_jobs: StageJobs,
+    schedule: Schedule,
+    on_experiment_done: Callable[[str], None] | None,
+) -> None:
+    loop = asyncio.get_running_loop()
+
+    coverage_queue: asyncio.Queue = asyncio.Queue()
+    extraction_queue: asyncio.Queue = asyncio.Queue()
+
+    remaining_runs = Counter(run.experiment_name for run in runs)
+
+    def get_peak_rss(run: Run) -> int:
+        return schedule.estimates[run.experiment_name].peak_rss
+
+    pending_runs = sorted(
+        runs, key=lambda run: -schedule.estimates[run.experiment_name].wall_time
+    )
+    running_memory = 0
+    memory_released = asyncio.Condition()
+
+    async def search_worker() -> None:
+        nonlocal running_memory
+
+        while True:
+            async with memory_released:
+                while True:
+                    if not pending_runs:
+                        return
+
+                    i = find_next_task(
+                        pending_runs,
+                        get_peak_rss,
+                        running_memory,
+                        schedule.memory_budget,
+                    )
+
+                    if i is not None:
+                        break
+
+                    await memory_released.wait()
+
+                run = pending_runs.pop(i)
+                running_memory += get_peak_rss(run)
+
+            try:
+                print(f"{run.experiment_name} : Run {run.index}")
+
+                return_code = await loop.run_in_executor(
+                    executor, execute_search_stage, run, None
+                )
+
+                coverage_queue.put_nowait((run, return_code))
+            finally:
+                async with memory_released:
+                    running_memory -= get_peak_rss(run)
+                    memory_released.notify_all()
+
+    async def coverage_worker() -> None:
+        while True:
+            run, return_code = await coverage_queue.get()
+
+            try:
+                await loop.run_in_executor(
+                    executor, execute_coverage_stage, run, return_code, None
+                )
+
+                extraction_queue.put_nowait(run)
+            finally:
+                coverage_queue.task_done()
+
+    async def extraction_worker() -> None:
+        while True:
+            run = await extraction_queue.get()
+
+            try:
+                record = await loop.run_in_executor(
+                    executor, execute_extraction_stage, run
+                )
+
+                print(
+                    f"{run.experiment_name} : Run {run.index} : Return code {record['return_code']}"
+                )
+
+                remaining_runs[run.experiment_name] -= 1
+
+                if (
+                    remaining_runs[run.experiment_name] == 0
+                    and on_experiment_done is not None
+                ):
+                    await loop.run_in_executor(
+                        executor, on_experiment_done, run.experiment_name
+                    )
+            finally:
+                extraction_queue.task_done()
+
+    async def join_stages() -> None:
+        await asyncio.gather(*search_workers)
+
+        for queue in (coverage_queue, extraction_queue):
+            await queue.join()
+
+    with ThreadPoolExecutor(max_workers=sum(stage_jobs)) as executor:
+        search_workers = [
+            asyncio.create_task(search_worker()) for _ in range(stage_jobs.search)
+        ]
+
+        workers = [
+            *search_workers,
+            *(
+                asyncio.create_task(coverage_worker())
+                for _ in range(stage_jobs.coverage)
+            ),
+            *(
+                asyncio.create_task(extraction_worker())
+                for _ in range(stage_jobs.extraction)
+            ),
+        ]
+
+        joined = asyncio.create_task(join_stages())
+
+        done, _ = await asyncio.wait(
+            [joined, *workers[stage_jobs.search :]],
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+        for task in (joined, *workers):
+            task.cancel()
+
+        await asyncio.gather(joined, *workers, return_exceptions=True)
+
+        for task in done:
+            task.result()
+
+
+def execute_runs(
+    runs: list[Run],
+    stage_jobs: StageJobs,
+    schedule: Schedule,
+    on_experiment_done: Callable[[str], None] | None,
+) -> None:
+    asyncio.run(execute_pipeline(runs, stage_jobs, schedule, on_experiment_done))
+
+
+def derive_seed(base_seed: int, experiment_name: str, run_index: int) -> int:
+    digest = hashlib.sha256(
+        f"{base_seed}:{experiment_name}:{run_index}".encode()
+    ).digest()
+
+    return int.from_bytes(digest, "big") % (2 << 64)
+
+
+def create_run(
+    experiment: Experiment, index: int, seed: int, settings: RunSettings
+) -> Run:
+    return Run(
+        settings.results_path,
+        experiment.experiment_name,
+        index,
+        experiment.module_name,
+        find_module_path(experiment.module_name, settings.project_path),
+        get_pynguin_environment(
+            settings.pynguin_path,
+            settings.environments_path,
+            experiment.pynguin_commit,
+        ),
+        settings.project_path,
+        os.path.join(settings.results_path, experiment.experiment_name, str(index)),
+        experiment.maximum_search_time,
+        experiment.timeout,
+        seed,
+        experiment.pynguin_args,
+        settings.forkserver,
+        settings.log_compression,
+        settings.log_max_size,
+        settings.kill_grace_period,
+        experiment.resource_limits,
+        settings.profiler,
+        settings.replay_jobs,
+        settings.replay_repeats,
+    )
+
+
+def prepare_run(
+    results_path: str,
+    experiment_name: str,
+    index: int,
+    seed: int,
+    resume: bool,
+    retry_return_codes: set[int | None],
+) -> int | None:
+    run_path = os.path.join(results_path, experiment_name, str(index))
+
+    if not os.path.exists(run_path):
+        return seed
+
+    if (
+        retry_return_codes
+        and os.path.exists(os.path.join(run_path, "return_code"))
+        and read_return_code(run_path) in retry_return_codes
+    ):
+        print(
+            f"{experiment_name} : Run {index} : Retrying because of return code {read_return_code(run_path)}"
+        )
+        clear_run = True
+    elif resume and not is_stage_done(run_path, "pynguin"):
+        print(f"{experiment_name} : Run {index} : Resuming from the pynguin stage")
+        clear_run = True
+    elif resume and not is_stage_done(run_path, "coverage"):
+        print(f"{experiment_name} : Run {index} : Resuming from the coverage stage")
+        clear_run = False
+    else:
+        print(
+            f"{experiment_name} : Run {index} : Skipping because the run path already exists"
+        )
+        return None
+
+    seed = read_seed(run_path, seed)
+
+    if clear_run:
+        shutil.rmtree(run_path)
+
+    with closing(open_results_store(results_path)) as results_store:
+        delete_run_record(results_store, experiment_name, index)
+
+    return seed
+
+
+def prepare_runs(
+    experiment: Experiment,
+    start: int,
+    end: int,
+    base_seed: int,
+    resume: bool,
+    retry_return_codes: set[int | None],
+    settings: RunSettings,
+) -> list[Run]:
+    runs = []
+    for i in range(start, end):
+        seed = prepare_run(
+            settings.results_path,
+            experiment.experiment_name,
+            i,
+            derive_seed(base_seed, experiment.experiment_name, i),
+            resume,
+            retry_return_codes,
+        )
+
+        if seed is not None:
+            runs.append(create_run(experiment, i, seed, settings))
+
+    return runs
+
+
+def is_run_pending(
+    run_path: str, resume: bool, retry_return_codes: set[int | None]
+) -> bool:
+    if not os.path.exists(run_path):
+        return True
+
+    if (
+        retry_return_codes
+        and os.path.exists(os.path.join(run_path, "return_code"))
+        and read_return_code(run_path) in retry_return_codes
+    ):
+        return True
+
+    return resume and not is_stage_done(run_path, "pynguin")
+
+
+def print_plan(
+    experiments: list[Experiment],
+    schedule: Schedule,
+    jobs: int,
+    resume: bool,
+    retry_return_codes: set[int | None],
+    results_path: str,
+) -> None:
+    print(
+        f'{"Experiment":<30}{"Runs":>6}{"History":>9}{"Wall time":>11}{"Peak RSS":>11}'
+    )
+
+    estimates = []
+    for experiment in experiments:
+        experiment_name = experiment.experiment_name
+        estimate = schedule.estimates[experiment_name]
+
+        nb_pending_runs = sum(
+            is_run_pending(
+                os.path.join(results_path, experiment_name, str(i)),
+                resume,
+                retry_return_codes,
+            )
+            for i in range(experiment.nb_runs)
+        )
+
+        estimates.extend([estimate] * nb_pending_runs)
+
+        print(
+            f"{experiment_name:<30}{nb_pending_runs:>6}{estimate.nb_records:>9}{estimate.wall_time:>10.0f}s{estimate.peak_rss / BYTES_IN_MEBIBYTE:>8.0f}MiB"
+        )
+
+    total_time = sum(estimate.wall_time for estimate in estimates)
+    makespan = simulate_schedule(estimates, jobs, schedule.memory_budget)
+
+    print()
+    print(f"Estimated total run time: {timedelta(seconds=round(total_time))}")
+    print(
+        f"Estimated wall-clock time with {jobs} jobs: {timedelta(seconds=round(makespan))}"
+    )
+
+
+def run_experiments(
+    experiments: list[Experiment],
+    stage_jobs: StageJobs,
+    schedule: Schedule,
+    base_seed: int,
+    resume: bool,
+    retry_return_codes: set[int | None],
+    settings: RunSettings,
+) -> None:
+    runs = []
+    for experiment in experiments:
+        runs.extend(
+            prepare_runs(
+                experiment,
+                0,
+                experiment.nb_runs,
+                base_seed,
+                resume,
+                retry_return_codes,
+                settings,
+            )
+        )
+
+    experiments_by_name = {
+        experiment.experiment_name: experiment for experiment in experiments
+    }
+
+    def write_experiment_summary(experiment_name: str) -> None:
+        experiment = experiments_by_name.pop(experiment_name)
+
+        write_summary(
+            settings.results_path,
+            experiment,
+            find_module_path(experiment.module_name, settings.project_path),
+        )
+
+    execute_runs(runs, stage_jobs, schedule, write_experiment_summary)
+
+    for experiment_name in list(experiments_by_name):
+        write_experiment_summary(experiment_name)
+
+
+def run_adaptive_experiments(
+    experiments: list[Experiment],
+    baseline_experiment_name: str,
+    min_runs: int,
+    batch_size: int,
+    alpha: float,
+    stage_jobs: StageJobs,
+    schedule: Schedule,
+    base_seed: int,
+    resume: bool,
+    retry_return_codes: set[int | None],
+    settings: RunSettings,
+) -> None:
+    from utils import compare_distributions
+
+    results_path = settings.results_path
+    project_path = settings.project_path
+
+    baseline_experiments = [
+        experiment
+        for experiment in experiments
+        if experiment.experiment_name == baseline_experiment_name
+    ]
+
+    for baseline_experiment in baseline_experiments:
+        execute_runs(
+            prepare_runs(
+                baseline_experiment,
+                0,
+                baseline_experiment.nb_runs,
+                base_seed,
+                resume,
+                retry_return_codes,
+                settings,
+            ),
+            stage_jobs,
+            schedule,
+            None,
+        )
+
+        write_summary(
+            results_path,
+            baseline_experiment,
+            find_module_path(baseline_experiment.module_name, project_path),
+        )
+
+    baseline_nb_runs = max(
+        experiment.nb_runs for experiment in baseline_experiments or experiments
+    )
+
+    with closing(open_results_store(results_path)) as results_store:
+        baseline_records = get_run_records(results_store, baseline_experiment_name)
+
+    baseline_coverages = [
+        record["coverage"]
+        for i, record in sorted(baseline_records.items())
+        if i < baseline_nb_runs
+    ]
+
+    if not baseline_coverages:
+        raise ValueError(f'No runs found for the baseline "{baseline_experiment_name}"')
+
+    print(
+        f"{baseline_experiment_name} : Baseline with {len(baseline_coverages)} runs"
+    )
+
+    active_experiments = [
+        experiment
+        for experiment in experiments
+        if experiment.experiment_name != baseline_experiment_name
+    ]
+
+    nb_runs_done = {experiment.experiment_name: 0 for experiment in active_experiments}
+
+    nb_looks = {
+        experiment.experiment_name: math.ceil(
+            max(experiment.nb_runs - min_runs, 0) / batch_size
+        )
+        + 1
+        for experiment in active_experiments
+    }
+
+    target_nb_runs = min_runs
+    while active_experiments:
+        runs = []
+        for experiment in active_experiments:
+            runs.extend(
+                prepare_runs(
+                    experiment,
+                    nb_runs_done[experiment.experiment_name],
+                    min(target_nb_runs, experiment.nb_runs),
+                    base_seed,
+                    resume,
+                    retry_return_codes,
+                    settings,
+                )
+            )
+
+        execute_runs(runs, stage_jobs, schedule, None)
+
+        remaining_experiments = []
+        for experiment in active_experiments:
+            experiment_name = experiment.experiment_name
+
+            nb_runs = min(target_nb_runs, experiment.nb_runs)
+            nb_runs_done[experiment_name] = nb_runs
+
+            coverages = [
+                record["coverage"]
+                for record in get_experiment_records(results_path, experiment, nb_runs)
+            ]
+
+            _, p_value, a12, difference = compare_distributions(
+                coverages, baseline_coverages
+            )
+
+            look_alpha = alpha / nb_looks[experiment_name]
+
+            print(
+                f"{experiment_name} : {nb_runs} runs, p-value {p_value:.4f} (threshold {look_alpha:.4f}), {difference} ({a12:.2f})"
+            )
+
+            if p_value < look_alpha:
+                stopping_reason = "conclusive"
+            elif nb_runs >= experiment.nb_runs:
+                stopping_reason = "maximum_runs"
+            else:
+                remaining_experiments.append(experiment)
+                continue
+
+            write_summary(
+                results_path,
+                experiment._replace(nb_runs=nb_runs),
+                find_module_path(experiment.module_name, project_path),
+                {
+                    "max_runs": experiment.nb_runs,
+                    "stopping_reason": stopping_reason,
+                    "baseline_experiment": baseline_experiment_name,
+                    "baseline_p_value": p_value,
+                    "baseline_a12": a12,
+                },
+            )
+
+        active_experiments = remaining_experiments
+        target_nb_runs += batch_size
+
+
+def renew_lease_until(
+    stop_event: threading.Event,
+    cancel_event: threading.Event,
+    queue_path: str,
+    owner: str,
+    lease_duration: float,
+    run: Run,
+) -> None:
+    with closing(open_work_queue(queue_path)) as work_queue:
+        while not stop_event.wait(lease_duration / 3):
+            if not renew_lease(
+                work_queue, run.experiment_name, run.index, owner, lease_duration
+            ):
+                print(
+                    f"{run.experiment_name} : Run {run.index} : Lease lost, stopping the run"
+                )
+                cancel_event.set()
+                return
+
+
+def execute_leased_run(
+    queue_path: str, owner: str, lease_duration: float, run: Run
+) -> int | None:
+    stop_event = threading.Event()
+    cancel_event = threading.Event()
 
-    formatted_pynguin_args = (arg.format(run_path=run_path) for arg in pynguin_args)
+    renewer = threading.Thread(
+        target=renew_lease_until,
+        args=(stop_event, cancel_event, queue_path, owner, lease_duration, run),
+        daemon=True,
+    )
+    renewer.start()
 
-    with open(f"{run_path}/seed", "w") as seed_file:
-        seed_file.write(f"{seed}")
+    try:
+        return_code = execute_run(run, cancel_event)
+    except BaseException:
+        with closing(open_work_queue(queue_path)) as work_queue:
+            release_work_item(work_queue, run.experiment_name, run.index, owner)
+        raise
+    finally:
+        stop_event.set()
+        renewer.join()
+
+    with closing(open_work_queue(queue_path)) as work_queue:
+        if is_run_cancelled(cancel_event):
+            release_work_item(work_queue, run.experiment_name, run.index, owner)
+            return None
+
+        complete_work_item(work_queue, run.experiment_name, run.index, owner)
+
+    return return_code
+
+
+def get_queued_runs_experiments(
+    work_queue: sqlite3.Connection,
+) -> dict[str, tuple[Experiment, int]]:
+    queued_experiments = {}
+    for experiment_name, experiment in get_queued_experiments(work_queue).items():
+        base_seed = experiment.pop("base_seed")
+        queued_experiments[experiment_name] = (Experiment(**experiment), base_seed)
+
+    return queued_experiments
+
+
+def run_work_queue(
+    queue_path: str,
+    lease_duration: float,
+    jobs: int,
+    settings: RunSettings,
+) -> None:
+    results_path = settings.results_path
+    project_path = settings.project_path
+
+    owner = f"{socket.gethostname()}:{os.getpid()}"
 
     with (
-        open(f"{run_path}/stdout.log", "w") as stdout_file,
-        open(f"{run_path}/stderr.log", "w") as stderr_file,
+        closing(open_work_queue(queue_path)) as work_queue,
+        ThreadPoolExecutor(max_workers=jobs) as executor,
     ):
-        try:
-            return_code = subprocess.run(
-                [
-                    "pynguin",
-                    "--module-name",
-                    module_name,
-                    "--project-path",
-                    project_path,
-                    "--output-path",
-                    run_path,
-                    "--report-dir",
-                    run_path,
-                    "--maximum-search-time",
-                    str(maximum_search_time),
-                    "--seed",
-                    str(seed),
-                    "--output-variables",
-                    "TargetModule",
-                    "AlgorithmIterations",
-                    "Coverage",
-                    "TotalTime",
-                    "SearchTime",
-                    "LineNos",
-                    "MutationScore",
-                    "-v",
-                    *formatted_pynguin_args,
-                ],
-                stdout=stdout_file,
-                stderr=stderr_file,
-                timeout=timeout,
-            ).returncode
-        except subprocess.TimeoutExpired:
-            return_code = None
+        queued_experiments = get_queued_runs_experiments(work_queue)
 
-    with open(f"{run_path}/return_code", "w") as info_file:
-        info_file.write(f"{return_code}")
+        futures = {}
+        while True:
+            while len(futures) < jobs:
+                work_item = acquire_work_item(work_queue, owner, lease_duration)
 
-    return return_code
+                if work_item is None:
+                    break
 
+                experiment_name, i = work_item
 
-def run_coverage(run_path: str, module_path: str) -> None:
-    try:
-        (test_file,) = filter(
-            lambda name: name.startswith("test_"), os.listdir(run_path)
+                if experiment_name not in queued_experiments:
+                    queued_experiments = get_queued_runs_experiments(work_queue)
+
+                experiment, base_seed = queued_experiments[experiment_name]
+
+                derived_seed = derive_seed(base_seed, experiment_name, i)
+
+                seed = prepare_run(
+                    results_path, experiment_name, i, derived_seed, True, set()
+                )
+
+                if seed is None:
+                    seed = read_seed(
+                        os.path.join(results_path, experiment_name, str(i)),
+                        derived_seed,
+                    )
+
+                run = create_run(experiment, i, seed, settings)
+
+                print(f"{experiment_name} : Run {i} : Leased by {owner}")
+
+                futures[
+                    executor.submit(
+                        execute_leased_run, queue_path, owner, lease_duration, run
+                    )
+                ] = run
+
+            if not futures:
+                if count_remaining_work_items(work_queue) == 0:
+                    break
+
+                time.sleep(min(lease_duration / 3, 60))
+                continue
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                run = futures.pop(future)
+                print(
+                    f"{run.experiment_name} : Run {run.index} : Return code {future.result()}"
+                )
+
+        queued_experiments = get_queued_runs_experiments(work_queue)
+
+    for experiment, _ in queued_experiments.values():
+        write_summary(
+            results_path,
+            experiment,
+            find_module_path(experiment.module_name, project_path),
         )
-    except ValueError:
-        return
 
-    subprocess.run(
-        [
-            "coverage",
-            "run",
-            "--branch",
-            "--include",
-            module_path,
-            "-m",
-            "pytest",
-            test_file,
-        ],
-        cwd=run_path,
-        stdout=subprocess.DEVNULL,
-    )
 
-    subprocess.run(
-        ["coverage", "json", "--pretty-print"],
-        cwd=run_path,
-        stdout=subprocess.DEVNULL,
-    )
+def resolve_pynguin_commit(pynguin_path: str, branch_name: str) -> str:
+    for revision in (branch_name, f"origin/{branch_name}"):
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}"],
+            cwd=pynguin_path,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
 
+        if result.returncode == 0:
+            return result.stdout.strip()
 
-def change_pynguin_branch(pynguin_path: str, branch_name: str) -> None:
-    subprocess.run(
-        ["git", "checkout", branch_name],
-        cwd=pynguin_path,
-        stdout=subprocess.DEVNULL,
-    )
+    raise ValueError(f'Unknown pynguin branch "{branch_name}"')
 
 
-def install_pynguin_dependencies(pynguin_path: str) -> None:
-    subprocess.run(
-        ["pip", "install", "-e", pynguin_path],
-        stdout=subprocess.DEVNULL,
-    )
+def get_pynguin_environment(
+    pynguin_path: str, environments_path: str, commit: str
+) -> str:
+    environment_path = os.path.abspath(os.path.join(environments_path, commit))
+    worktree_path = os.path.join(environment_path, "worktree")
+    venv_path = os.path.join(environment_path, "venv")
+    ready_path = os.path.join(environment_path, "ready")
+    pynguin_executable = os.path.join(venv_path, "bin", "pynguin")
+
+    if os.path.exists(ready_path):
+        return pynguin_executable
+
+    os.makedirs(environments_path, exist_ok=True)
+
+    with open(os.path.join(environments_path, f"{commit}.lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        if os.path.exists(ready_path):
+            return pynguin_executable
+
+        print(f"Creating the pynguin environment of commit {commit}")
+
+        if os.path.exists(environment_path):
+            shutil.rmtree(environment_path)
+
+        subprocess.run(
+            ["git", "worktree", "prune"],
+            cwd=pynguin_path,
+            stdout=subprocess.DEVNULL,
+        )
+
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", "--force", worktree_path, commit],
+            cwd=pynguin_path,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+        subprocess.run([sys.executable, "-m", "venv", venv_path], check=True)
+
+        venv_python = os.path.join(venv_path, "bin", "python")
+
+        venv_site_packages = subprocess.run(
+            [venv_python, "-c", "import sysconfig; print(sysconfig.get_path('purelib'))"],
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        with open(
+            os.path.join(venv_site_packages, "_base_environment.pth"), "w"
+        ) as pth_file:
+            pth_file.write(f"{sysconfig.get_path('purelib')}\n")
+
+        subprocess.run(
+            [venv_python, "-m", "pip", "install", "-e", worktree_path],
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+        with open(ready_path, "w"):
+            pass
+
+    return pynguin_executable
 
 
 def split_args(args: str) -> list[str]:
     return [arg for arg in args.split(" ") if arg]
 
 
-def get_lines(node: ast.AST) -> set[int]:
+def get_lines(tree: ast.AST) -> set[int]:
     lines: set[int] = set()
 
-    if hasattr(node, "lineno"):
-        lines.add(node.lineno)
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
 
-    for child in ast.iter_child_nodes(node):
-        if isinstance(child, (ast.mod, ast.stmt, ast.excepthandler, ast.match_case)):
-            lines.update(get_lines(child))
+        if hasattr(node, "lineno"):
+            lines.add(node.lineno)
 
-    if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-        for decorator in node.decorator_list:
-            lines.update(get_lines(decorator))
+        for child in ast.iter_child_nodes(node):
+            if isinstance(
+                child, (ast.mod, ast.stmt, ast.excepthandler, ast.match_case)
+            ):
+                nodes.append(child)
+
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
+            nodes.extend(node.decorator_list)
 
     return lines
 
 
+def find_module_path(module_name: str, project_path: str) -> str:
+    search_paths = [os.path.abspath(project_path), *sys.path]
+
+    module_names = module_name.split(".")
+
+    spec = None
+    for i in range(len(module_names)):
+        name = ".".join(module_names[: i + 1])
+
+        spec = importlib.machinery.PathFinder.find_spec(name, search_paths)
+
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+        search_paths = spec.submodule_search_locations
+
+    if spec is None or spec.origin is None or not spec.has_location:
+        raise ModuleNotFoundError(
+            f"Module '{module_name}' has no source file", name=module_name
+        )
+
+    return spec.origin
+
+
+def get_module_lines(results_path: str, module_path: str) -> set[int]:
+    with open(module_path, "rb") as f:
+        module_source_code = f.read()
+
+    source_hash = hashlib.sha256(module_source_code).hexdigest()
+
+    with closing(open_results_store(results_path)) as results_store:
+        lines = get_executable_lines(results_store, source_hash)
+
+        if lines is None:
+            lines = sorted(get_lines(ast.parse(module_source_code)))
+
+            insert_executable_lines(results_store, source_hash, lines)
+
+    return set(lines)
+
+
+def parse_test_timings(run_path: str) -> dict:
+    try:
+        with open(os.path.join(run_path, TEST_TIMINGS_NAME), "r") as f:
+            replays = json.load(f)["replays"]
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if not replays:
+        return {}
+
+    tests = replays[0]
+
+    slow_tests = sorted(
+        ([name, test["duration"], test["peak_rss"]] for name, test in tests.items()),
+        key=lambda slow_test: -slow_test[1],
+    )
+
+    flaky_tests = sorted(
+        name
+        for name in tests
+        if len({replay.get(name, {}).get("outcome") for replay in replays}) > 1
+    )
+
+    return {
+        "test_count": len(tests),
+        "test_replay_time": sum(test["duration"] for test in tests.values()),
+        "slow_tests": slow_tests[:SLOW_TEST_COUNT],
+        "flaky_tests": flaky_tests,
+    }
+
+
+def parse_run(run_path: str, maximum_search_time: int, timeout: int) -> dict:
+    statistics_path = os.path.join(run_path, "statistics.csv")
+
+    coverage_path = os.path.join(run_path, "coverage.json")
+
+    coverage_time_path = os.path.join(run_path, "coverage_time")
+
+    telemetry_path = os.path.join(run_path, "telemetry.json")
+
+    crash_test_count = len(
+        tuple(
+            filter(
+                lambda filename: filename.startswith("crash_test_"),
+                os.listdir(run_path),
+            )
+        )
+    )
+
+    try:
+        with open(statistics_path, "r") as f:
+            (statistics,) = csv.DictReader(f)
+
+        iterations = int(statistics["AlgorithmIterations"])
+        coverage = float(statistics["Coverage"])
+        total_time = int(statistics["TotalTime"])
+        search_time = int(statistics["SearchTime"])
+        try:
+            mutation_score = float(statistics["MutationScore"])
+        except ValueError:
+            mutation_score = 0.0
+
+        coverage_timeline = [
+            round(float(statistics[column]), 6)
+            for _, column in sorted(
+                (int(column.removeprefix("CoverageTimeline_T")), column)
+                for column in statistics
+                if column.startswith("CoverageTimeline_T")
+            )
+        ]
+
+    except (FileNotFoundError, ValueError):
+        iterations = 0
+        coverage = 0.0
+        total_time = timeout
+        search_time = maximum_search_time
+        mutation_score = 0.0
+        coverage_timeline = []
+
+    try:
+        with open(coverage_path, "r") as f:
+            coverage_data = json.load(f)
+
+            (file_data,) = coverage_data["files"].values()
+
+            executed_lines = file_data["executed_lines"]
+    except (FileNotFoundError, ValueError):
+        executed_lines = []
+
+    return_code = read_return_code(run_path)
+
+    crashes = scan_run_crashes(run_path, return_code)
+
+    try:
+        with open(os.path.join(run_path, "limit_hit"), "r") as f:
+            limit_hit = f.read()
+    except FileNotFoundError:
+        limit_hit = None
+
+    try:
+        with open(coverage_time_path, "r") as f:
+            coverage_time = int(f.read())
+    except FileNotFoundError:
+        coverage_time = 0
+
+    try:
+        with open(telemetry_path, "r") as f:
+            telemetry = json.load(f)
+
+        resource_usage = {
+            "wall_time": telemetry["wall_time"],
+            "cpu_user_time": telemetry["user_time"],
+            "cpu_system_time": telemetry["system_time"],
+            "peak_rss": telemetry["peak_rss"],
+        }
+    except FileNotFoundError:
+        resource_usage = {}
+
+    return {
+        "iterations": iterations,
+        "coverage": coverage,
+        "total_time": total_time,
+        "search_time": search_time,
+        "mutation_score": mutation_score,
+        "crash_test_count": crash_test_count,
+        "executed_lines": executed_lines,
+        "return_code": return_code,
+        "limit_hit": limit_hit,
+        "coverage_time": coverage_time,
+        "coverage_timeline": coverage_timeline,
+        **parse_test_timings(run_path),
+        "crashes": crashes,
+        **resource_usage,
+    }
+
+
+def get_experiment_records(
+    results_path: str, experiment: Experiment, nb_runs: int
+) -> list[dict]:
+    experiment_name = experiment.experiment_name
+    experiment_path = os.path.join(results_path, experiment_name)
+
+    with closing(open_results_store(results_path)) as results_store:
+        run_records = get_run_records(results_store, experiment_name)
+
+        for i in range(nb_runs):
+            if i in run_records:
+                continue
+
+            run_path = os.path.join(experiment_path, str(i))
+
+            run_records[i] = parse_run(
+                run_path, experiment.maximum_search_time, experiment.timeout
+            )
+
+            insert_run_record(results_store, experiment_name, i, run_records[i])
+            insert_run_crashes(
+                results_store, experiment_name, i, run_records[i]["crashes"]
+            )
+
+    return [run_records[i] for i in range(nb_runs)]
+
+
+def save_array(path: str, array) -> None:
+    import numpy as np
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary_path, "wb") as f:
+        np.save(f, array)
+
+    os.replace(temporary_path, path)
+
+
+def write_line_hits(
+    experiment_path: str, lines: list[int], records: list[dict]
+) -> None:
+    import numpy as np
+
+    line_numbers = np.array(lines, dtype=np.int64)
+
+    line_hits = np.zeros((len(records), len(line_numbers)), dtype=np.bool_)
+    for i, record in enumerate(records):
+        line_hits[i, np.searchsorted(line_numbers, record["executed_lines"])] = True
+
+    save_array(os.path.join(experiment_path, "line_numbers.npy"), line_numbers)
+    save_array(os.path.join(experiment_path, "line_hits.npy"), line_hits)
+
+
+def write_coverage_timelines(experiment_path: str, records: list[dict]) -> dict:
+    if not any(record.get("coverage_timeline") for record in records):
+        return {}
+
+    import numpy as np
+    from coverage_timeline import (
+        COVERAGE_TIMELINES_NAME,
+        COVERAGE_THRESHOLDS,
+        create_coverage_timelines,
+        get_coverage_aucs,
+        get_times_to_coverage,
+    )
+
+    coverage_timelines = create_coverage_timelines(
+        [record.get("coverage_timeline", []) for record in records]
+    )
+
+    save_array(
+        os.path.join(experiment_path, COVERAGE_TIMELINES_NAME), coverage_timelines
+    )
+
+    timeline_summary = {
+        "timeline_interval": TIMELINE_INTERVAL,
+        "mean_coverage_auc": float(get_coverage_aucs(coverage_timelines).mean()),
+    }
+
+    for threshold in COVERAGE_THRESHOLDS:
+        times_to_coverage = get_times_to_coverage(
+            coverage_timelines, threshold, TIMELINE_INTERVAL
+        )
+
+        median_time_to_coverage = float(np.median(times_to_coverage))
+
+        percentage = round(threshold * 100)
+
+        timeline_summary[f"median_time_to_{percentage}_coverage"] = (
+            median_time_to_coverage if math.isfinite(median_time_to_coverage) else None
+        )
+        timeline_summary[f"reached_{percentage}_coverage_count"] = int(
+            np.isfinite(times_to_coverage).sum()
+        )
+
+    return timeline_summary
+
+
+def get_test_summary(records: list[dict]) -> dict:
+    test_records = [
+        (i, record) for i, record in enumerate(records) if "test_count" in record
+    ]
+
+    if not test_records:
+        return {}
+
+    slow_tests = sorted(
+        (
+            {"run": i, "test": name, "duration": duration, "peak_rss": peak_rss}
+            for i, record in test_records
+            for name, duration, peak_rss in record["slow_tests"]
+        ),
+        key=lambda slow_test: -slow_test["duration"],
+    )
+
+    flaky_tests = [
+        {"run": i, "test": name}
+        for i, record in test_records
+        for name in record["flaky_tests"]
+    ]
+
+    return {
+        "mean_test_count": sum(record["test_count"] for _, record in test_records)
+        / len(test_records),
+        "mean_test_replay_time": sum(
+            record["test_replay_time"] for _, record in test_records
+        )
+        / len(test_records),
+        "slow_tests": slow_tests[:SLOW_TEST_COUNT],
+        "flaky_test_count": len(flaky_tests),
+        "flaky_tests": flaky_tests,
+    }
+
+
+def write_summary(
+    results_path: str,
+    experiment: Experiment,
+    module_path: str,
+    extra_summary: dict | None = None,
+) -> None:
+    experiment_name = experiment.experiment_name
+    experiment_path = os.path.join(results_path, experiment_name)
+    nb_runs = experiment.nb_runs
+
+    print(f"{experiment_name} : Getting statistics")
+
+    lines = get_module_lines(results_path, module_path)
+
+    records = get_experiment_records(results_path, experiment, nb_runs)
+
+    peak_rss = [record["peak_rss"] for record in records if "peak_rss" in record]
+    wall_times = [record["wall_time"] for record in records if "wall_time" in record]
+    startup_times = [
+        record["wall_time"] - record["total_time"]
+        for record in records
+        if "wall_time" in record and record["return_code"] == 0
+    ]
+    cpu_utilisations = [
+        (record["cpu_user_time"] + record["cpu_system_time"])
+        * NANOSECONDS_IN_SECOND
+        / record["wall_time"]
+        for record in records
+        if record.get("wall_time", 0) > 0
+    ]
+
+    executed_lines_counter = Counter({line: 0 for line in lines})
+    return_code_counter = Counter()
+    limit_hit_counter = Counter()
+    for record in records:
+        executed_lines_counter.update(record["executed_lines"])
+
+        if record.get("limit_hit") is None:
+            return_code_counter[record["return_code"]] += 1
+        else:
+            return_code_counter["limit"] += 1
+            limit_hit_counter[record["limit_hit"]] += 1
+
+    write_line_hits(experiment_path, sorted(executed_lines_counter), records)
+
+    timeline_summary = write_coverage_timelines(experiment_path, records)
+
+    profile_summary = write_experiment_profile(
+        experiment_path,
+        [os.path.join(experiment_path, str(i)) for i in range(nb_runs)],
+    )
+
+    summary = {
+        "experiment_name": experiment_name,
+        "nb_runs": nb_runs,
+        "mean_iterations": sum(record["iterations"] for record in records) / nb_runs,
+        "mean_coverage": sum(record["coverage"] for record in records) / nb_runs,
+        "mean_total_time": sum(record["total_time"] for record in records)
+        / (nb_runs * NANOSECONDS_IN_SECOND),
+        "mean_search_time": sum(record["search_time"] for record in records)
+        / (nb_runs * NANOSECONDS_IN_SECOND),
+        "mean_mutation_score": sum(record["mutation_score"] for record in records)
+        / nb_runs,
+        "mean_wall_time": (
+            sum(wall_times) / (len(wall_times) * NANOSECONDS_IN_SECOND)
+            if wall_times
+            else 0.0
+        ),
+        "mean_startup_time": (
+            sum(startup_times) / (len(startup_times) * NANOSECONDS_IN_SECOND)
+            if startup_times
+            else 0.0
+        ),
+        "mean_coverage_time": sum(record.get("coverage_time", 0) for record in records)
+        / (nb_runs * NANOSECONDS_IN_SECOND),
+        "crash_test_count": sum(record["crash_test_count"] for record in records),
+        "unique_crash_count": len(
+            {
+                crash["signature"]
+                for record in records
+                for crash in record.get("crashes", [])
+            }
+        ),
+        "mean_peak_rss": sum(peak_rss) / len(peak_rss) if peak_rss else 0.0,
+        "max_peak_rss": max(peak_rss, default=0),
+        "mean_cpu_utilisation": (
+            sum(cpu_utilisations) / len(cpu_utilisations) if cpu_utilisations else 0.0
+        ),
+        "max_cpu_utilisation": max(cpu_utilisations, default=0.0),
+        "executed_lines_counter": executed_lines_counter,
+        "return_code_counter": return_code_counter,
+        "limit_hit_counter": limit_hit_counter,
+        **timeline_summary,
+        **profile_summary,
+        **get_test_summary(records),
+    }
+
+    if extra_summary is not None:
+        summary.update(extra_summary)
+
+    summary_path = os.path.join(experiment_path, "summary.json")
+    temporary_summary_path = f"{summary_path}.{os.getpid()}.tmp"
+
+    with open(temporary_summary_path, "w") as f:
+        json.dump(summary, f, indent=4)
+
+    os.replace(temporary_summary_path, summary_path)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--modules-csv-path", default="modules.csv")
@@ -148,8 +2074,36 @@ def main() -> None:
     parser.add_argument("--project-path", default=".")
     parser.add_argument("--pynguin-path", default="pynguin")
     parser.add_argument("--results-path", default="results")
+    parser.add_argument("--environments-path", default=None)
     parser.add_argument("--nb-runs", type=int, default=30)
     parser.add_argument("--base-seed", type=int, default=time.time_ns())
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--memory-per-job", type=int, default=4096)
+    parser.add_argument("--memory-budget", type=int, default=None)
+    parser.add_argument("--history-paths", nargs="+", default=[])
+    parser.add_argument("--plan", action="store_true")
+    parser.add_argument("--coverage-jobs", type=int, default=0)
+    parser.add_argument("--extraction-jobs", type=int, default=1)
+    parser.add_argument("--resume", action="store_true")
+    parser.add_argument(
+        "--retry-return-codes", nargs="+", type=parse_return_code, default=[]
+    )
+    parser.add_argument("--queue-path", default=None)
+    parser.add_argument("--lease-duration", type=float, default=600)
+    parser.add_argument("--baseline-experiment", default=None)
+    parser.add_argument("--min-runs", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--forkserver", action="store_true")
+    parser.add_argument("--aggregate-only", action="store_true")
+    parser.add_argument(
+        "--log-compression", choices=("none", "gzip", "zstd"), default="gzip"
+    )
+    parser.add_argument("--log-max-size", type=int, default=None)
+    parser.add_argument("--kill-grace-period", type=int, default=30)
+    parser.add_argument("--profile", choices=PROFILERS, default=None)
+    parser.add_argument("--replay-jobs", type=int, default=1)
+    parser.add_argument("--replay-repeats", type=int, default=1)
 
     args = parser.parse_args()
 
@@ -159,8 +2113,72 @@ def main() -> None:
     results_path = args.results_path
     nb_runs = args.nb_runs
     base_seed = args.base_seed
+    resume = args.resume
+    retry_return_codes = set(args.retry_return_codes)
+    queue_path = args.queue_path
+    baseline_experiment_name = args.baseline_experiment
+
+    if queue_path is not None and baseline_experiment_name is not None:
+        parser.error("--baseline-experiment cannot be used with --queue-path")
+
+    if args.aggregate_only and (
+        queue_path is not None or baseline_experiment_name is not None
+    ):
+        parser.error(
+            "--aggregate-only cannot be used with --queue-path or --baseline-experiment"
+        )
+
+    if args.environments_path is None:
+        environments_path = os.path.join(results_path, ".environments")
+    else:
+        environments_path = args.environments_path
+
+    if args.log_compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            parser.error("--log-compression zstd needs the zstandard package")
+
+    if args.profile == "cprofile" and args.forkserver:
+        parser.error("--profile cprofile cannot be used with --forkserver")
+
+    if args.profile == "py-spy" and shutil.which("py-spy") is None:
+        parser.error("--profile py-spy needs py-spy to be installed")
+
+    if args.log_max_size is None:
+        log_max_size = None
+    else:
+        log_max_size = args.log_max_size * BYTES_IN_MEBIBYTE
+
+    settings = RunSettings(
+        pynguin_path,
+        environments_path,
+        project_path,
+        results_path,
+        args.forkserver,
+        args.log_compression,
+        log_max_size,
+        args.kill_grace_period,
+        args.profile,
+        max(1, args.replay_jobs),
+        max(1, args.replay_repeats),
+    )
+
+    if args.jobs > 0:
+        jobs = args.jobs
+    else:
+        jobs = get_default_jobs(args.memory_per_job * BYTES_IN_MEBIBYTE)
 
-    random.seed(base_seed)
+    if args.coverage_jobs > 0:
+        coverage_jobs = args.coverage_jobs
+    else:
+        coverage_jobs = max(1, jobs // 4)
+
+    stage_jobs = StageJobs(jobs, coverage_jobs, max(1, args.extraction_jobs))
+
+    print(
+        f"Using {jobs} jobs, {coverage_jobs} coverage jobs and {stage_jobs.extraction} extraction jobs"
+    )
 
     with open(modules_csv_path, "r") as modules_csv_file:
         modules = [
@@ -171,8 +2189,9 @@ def main() -> None:
                 int(maximum_search_time),
                 int(timeout),
                 split_args(pynguin_args),
+                parse_resource_limits(" ".join(resource_limits)),
             )
-            for module_name, experiment_name, branch_name, maximum_search_time, timeout, pynguin_args in csv.reader(
+            for module_name, experiment_name, branch_name, maximum_search_time, timeout, pynguin_args, *resource_limits in csv.reader(
                 modules_csv_file
             )
         ]
@@ -191,6 +2210,7 @@ def main() -> None:
     else:
         modules_end = int(modules_end_string)
 
+    experiments = []
     for (
         module_name,
         experiment_name,
@@ -198,140 +2218,114 @@ def main() -> None:
         maximum_search_time,
         timeout,
         pynguin_args,
+        resource_limits,
     ) in modules[modules_start:modules_end]:
         print(
             f'{experiment_name} : Doing {nb_runs} runs with "{module_name}" on branch "{branch_name}"'
         )
 
-        change_pynguin_branch(pynguin_path, branch_name)
-
-        install_pynguin_dependencies(pynguin_path)
-
-        experiment_path = os.path.join(results_path, experiment_name)
-
-        module = importlib.import_module(module_name)
-
-        module_path = inspect.getfile(module)
-
-        for i in range(nb_runs):
-            print(f"Run {i}")
-            run_path = os.path.join(experiment_path, str(i))
-
-            seed = random.randrange(0, 2 << 64)
-
-            if os.path.exists(run_path):
-                print("Skipping because the run path already exists")
-                continue
-
-            return_code = run_pynguin(
+        experiments.append(
+            Experiment(
                 module_name,
-                project_path,
-                run_path,
+                experiment_name,
+                (
+                    branch_name
+                    if args.aggregate_only or args.plan
+                    else resolve_pynguin_commit(pynguin_path, branch_name)
+                ),
                 maximum_search_time,
                 timeout,
-                seed,
-                *pynguin_args,
+                pynguin_args,
+                nb_runs,
+                resource_limits,
             )
+        )
 
-            if return_code == 0:
-                run_coverage(run_path, module_path)
-
-        print(f"{experiment_name} : Getting statistics")
-
-        module_source_code = inspect.getsource(module)
-
-        module_tree = ast.parse(module_source_code)
+    if args.aggregate_only:
+        for experiment in experiments:
+            write_summary(
+                results_path,
+                experiment,
+                find_module_path(experiment.module_name, project_path),
+            )
+        return
 
-        lines = get_lines(module_tree)
+    if args.memory_budget is None:
+        memory_budget = None
+    else:
+        memory_budget = args.memory_budget * BYTES_IN_MEBIBYTE
+
+    schedule = Schedule(
+        get_run_estimates(
+            experiments,
+            [results_path, *args.history_paths],
+            args.memory_per_job * BYTES_IN_MEBIBYTE,
+        ),
+        memory_budget,
+    )
 
-        all_iterations = []
-        all_coverage = []
-        all_total_time = []
-        all_search_time = []
-        all_mutation_score = []
-        crash_test_count = 0
-        executed_lines_counter = Counter({line: 0 for line in lines})
-        return_code_counter = Counter()
-        for i in range(nb_runs):
-            run_path = os.path.join(experiment_path, str(i))
+    if args.plan:
+        print_plan(
+            experiments, schedule, jobs, resume, retry_return_codes, results_path
+        )
+        return
 
-            statistics_path = os.path.join(run_path, "statistics.csv")
+    if queue_path is not None:
+        with closing(open_work_queue(queue_path)) as work_queue:
+            for experiment in experiments:
+                enqueue_experiment(
+                    work_queue,
+                    experiment.experiment_name,
+                    {**experiment._asdict(), "base_seed": base_seed},
+                    list(range(experiment.nb_runs)),
+                )
 
-            coverage_path = os.path.join(run_path, "coverage.json")
+    if any(experiment.resource_limits for experiment in experiments):
+        cgroup_parent_path = get_cgroup_parent_path()
 
-            return_code_path = os.path.join(run_path, "return_code")
+        if cgroup_parent_path is None:
+            print("Applying resource limits with setrlimit only")
 
-            crash_test_count += len(
-                tuple(
-                    filter(
-                        lambda filename: filename.startswith("crash_test_"),
-                        os.listdir(run_path),
+            for experiment in experiments:
+                if "processes" in experiment.resource_limits:
+                    print(
+                        f"{experiment.experiment_name} : The processes limit needs cgroup v2 and is not applied"
                     )
-                )
-            )
+        else:
+            print(f"Applying resource limits in {cgroup_parent_path}")
 
-            try:
-                with open(statistics_path, "r") as f:
-                    (statistics,) = csv.DictReader(f)
-
-                iterations = int(statistics["AlgorithmIterations"])
-                coverage = float(statistics["Coverage"])
-                total_time = int(statistics["TotalTime"])
-                search_time = int(statistics["SearchTime"])
-                try:
-                    mutation_score = float(statistics["MutationScore"])
-                except ValueError:
-                    mutation_score = 0.0
-
-            except FileNotFoundError:
-                iterations = 0
-                coverage = 0.0
-                total_time = timeout
-                search_time = maximum_search_time
-                mutation_score = 0.0
-
-            try:
-                with open(coverage_path, "r") as f:
-                    coverage_data = json.load(f)
-
-                    (file_data,) = coverage_data["files"].values()
-
-                    executed_lines = file_data["executed_lines"]
-            except FileNotFoundError:
-                executed_lines = []
-
-            with open(return_code_path, "r") as f:
-                try:
-                    return_code = int(f.read())
-                except ValueError:
-                    return_code = None
-
-            all_iterations.append(iterations)
-            all_coverage.append(coverage)
-            all_total_time.append(total_time)
-            all_search_time.append(search_time)
-            all_mutation_score.append(mutation_score)
-            executed_lines_counter.update(executed_lines)
-            return_code_counter[return_code] += 1
-
-        summary = {
-            "experiment_name": experiment_name,
-            "nb_runs": nb_runs,
-            "mean_iterations": sum(all_iterations) / nb_runs,
-            "mean_coverage": sum(all_coverage) / nb_runs,
-            "mean_total_time": sum(all_total_time) / (nb_runs * NANOSECONDS_IN_SECOND),
-            "mean_search_time": sum(all_search_time)
-            / (nb_runs * NANOSECONDS_IN_SECOND),
-            "mean_mutation_score": sum(all_mutation_score) / nb_runs,
-            "crash_test_count": crash_test_count,
-            "executed_lines_counter": executed_lines_counter,
-            "return_code_counter": return_code_counter,
-        }
+    signal.signal(signal.SIGINT, interrupt_process_groups)
 
-        summary_path = os.path.join(experiment_path, "summary.json")
-
-        with open(summary_path, "w") as f:
-            json.dump(summary, f, indent=4)
+    try:
+        if queue_path is not None:
+            run_work_queue(queue_path, args.lease_duration, jobs, settings)
+        elif baseline_experiment_name is not None:
+            run_adaptive_experiments(
+                experiments,
+                baseline_experiment_name,
+                args.min_runs,
+                args.batch_size,
+                args.alpha,
+                stage_jobs,
+                schedule,
+                base_seed,
+                resume,
+                retry_return_codes,
+                settings,
+            )
+        else:
+            run_experiments(
+                experiments,
+                stage_jobs,
+                schedule,
+                base_seed,
+                resume,
+                retry_return_codes,
+                settings,
+            )
+    finally:
+        signal_process_groups(signal.SIGKILL)
+        stop_forkservers()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+from resource_limits import enter_resource_limits
+import importlib
+import selectors
+import argparse
+import traceback
+import socket
+import json
+import sys
+import os
+
+
+def run_pynguin_child(
+    argv: list[str],
+    cwd: str,
+    stdout_fd: int,
+    stderr_fd: int,
+    cgroup_path: str | None,
+    rlimits: list[list],
+) -> None:
+    exit_code = 1
+    try:
+        os.setsid()
+        enter_resource_limits(cgroup_path, rlimits)
+        os.chdir(cwd)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+
+        import pynguin.cli
+
+        exit_code = pynguin.cli.main(["pynguin", *argv])
+    except SystemExit as exception:
+        if isinstance(exception.code, int):
+            exit_code = exception.code
+        elif exception.code is None:
+            exit_code = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def start_child(
+    server: socket.socket,
+    connection: socket.socket,
+    children: dict[int, socket.socket],
+) -> None:
+    data, fds, _, _ = socket.recv_fds(connection, 1 << 20, 2)
+
+    if len(fds) != 2:
+        for fd in fds:
+            os.close(fd)
+        connection.close()
+        return
+
+    request = json.loads(data)
+
+    stdout_fd, stderr_fd = fds
+
+    pid = os.fork()
+
+    if pid == 0:
+        server.close()
+        connection.close()
+        for child_connection in children.values():
+            child_connection.close()
+
+        run_pynguin_child(
+            request["argv"],
+            request["cwd"],
+            stdout_fd,
+            stderr_fd,
+            request["cgroup_path"],
+            request["rlimits"],
+        )
+
+    os.close(stdout_fd)
+    os.close(stderr_fd)
+
+    connection.sendall(f'{json.dumps({"pid": pid})}\n'.encode())
+
+    children[pid] = connection
+
+
+def reap_children(children: dict[int, socket.socket]) -> None:
+    while children:
+        try:
+            pid, status, rusage = os.wait4(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+
+        if pid == 0:
+            return
+
+        connection = children.pop(pid, None)
+
+        if connection is None:
+            continue
+
+        result = {
+            "return_code": os.waitstatus_to_exitcode(status),
+            "user_time": rusage.ru_utime,
+            "system_time": rusage.ru_stime,
+            "max_rss": rusage.ru_maxrss,
+        }
+
+        try:
+            connection.sendall(f"{json.dumps(result)}\n".encode())
+        except OSError:
+            pass
+
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("socket_path")
+    parser.add_argument("module_name")
+    parser.add_argument("project_path")
+
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.project_path))
+
+    import pynguin.cli
+
+    importlib.import_module(args.module_name)
+
+    sys.modules.pop(args.module_name, None)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(args.socket_path)
+    server.listen()
+
+    print("ready", flush=True)
+
+    children: dict[int, socket.socket] = {}
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(server, selectors.EVENT_READ)
+
+        while True:
+            for _ in selector.select(timeout=0.1):
+                connection, _ = server.accept()
+                start_child(server, connection, children)
+
+            reap_children(children)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+from experiment import get_lines, NANOSECONDS_IN_SECOND, BYTES_IN_MEBIBYTE
+from experiment import TIMELINE_INTERVAL
+import numpy as np
+import argparse
+import json
+import csv
+import ast
+import os
+
+
+SYNTHETIC_MODULE_NAME = "synthetic_module"
+
+SYNTHETIC_RESULTS_NAME = "synthetic_results.json"
+
+FUNCTION_SIZE = 10
+
+MAXIMUM_SEARCH_TIME = 600
+
+TIMEOUT = 1200
+
+RETURN_CODES = (0, None, -11, -9, 1)
+
+RETURN_CODE_PROBABILITIES = (0.93, 0.03, 0.02, 0.01, 0.01)
+
+
+def write_synthetic_module(project_path: str, nb_lines: int) -> str:
+    os.makedirs(project_path, exist_ok=True)
+
+    module_path = os.path.join(project_path, f"{SYNTHETIC_MODULE_NAME}.py")
+
+    with open(module_path, "w") as f:
+        for i in range(max(1, nb_lines // FUNCTION_SIZE)):
+            f.write(f"def function_{i}(x):\n")
+            for _ in range(FUNCTION_SIZE - 2):
+                f.write("    x = x + 1\n")
+            f.write("    return x\n")
+
+    return module_path
+
+
+def write_coverage_report(
+    run_path: str, module_path: str, lines: np.ndarray, executed: np.ndarray
+) -> None:
+    executed_lines = lines[executed].tolist()
+    missing_lines = lines[~executed].tolist()
+
+    summary = {
+        "covered_lines": len(executed_lines),
+        "num_statements": len(lines),
+        "percent_covered": 100 * len(executed_lines) / len(lines),
+        "missing_lines": len(missing_lines),
+        "excluded_lines": 0,
+    }
+
+    coverage_report = {
+        "meta": {"format": 2, "branch_coverage": False, "show_contexts": False},
+        "files": {
+            module_path: {
+                "executed_lines": executed_lines,
+                "summary": summary,
+                "missing_lines": missing_lines,
+                "excluded_lines": [],
+            }
+        },
+        "totals": summary,
+    }
+
+    with open(os.path.join(run_path, "coverage.json"), "w") as f:
+        json.dump(coverage_report, f)
+
+
+def write_run(
+    rng: np.random.Generator,
+    run_path: str,
+    module_path: str,
+    lines: np.ndarray,
+    function_indexes: np.ndarray,
+    function_probabilities: np.ndarray,
+) -> None:
+    os.makedirs(run_path, exist_ok=True)
+
+    return_code = RETURN_CODES[
+        rng.choice(len(RETURN_CODES), p=RETURN_CODE_PROBABILITIES)
+    ]
+
+    reached_functions = rng.random(len(function_probabilities)) < function_probabilities
+    executed = reached_functions[function_indexes] & (rng.random(len(lines)) < 0.95)
+    coverage = executed.mean()
+
+    search_time = int(rng.uniform(0.5, 1) * MAXIMUM_SEARCH_TIME * NANOSECONDS_IN_SECOND)
+    total_time = search_time + int(rng.uniform(5, 30) * NANOSECONDS_IN_SECOND)
+
+    timeline_times = np.arange(1, MAXIMUM_SEARCH_TIME // TIMELINE_INTERVAL + 1)
+    coverage_timeline = coverage * (
+        1 - np.exp(-timeline_times * TIMELINE_INTERVAL / rng.uniform(10, 200))
+    )
+
+    with open(os.path.join(run_path, "seed"), "w") as f:
+        f.write(f"{rng.integers(2**63)}")
+
+    for name in ("stdout.log", "stderr.log"):
+        with open(os.path.join(run_path, name), "w") as f:
+            f.write(f"Synthetic {name}\n")
+
+    if return_code is not None:
+        with open(os.path.join(run_path, "statistics.csv"), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                (
+                    "TargetModule",
+                    "AlgorithmIterations",
+                    "Coverage",
+                    "TotalTime",
+                    "SearchTime",
+                    "LineNos",
+                    "MutationScore",
+                    *(f"CoverageTimeline_T{i}" for i in timeline_times),
+                )
+            )
+            writer.writerow(
+                (
+                    SYNTHETIC_MODULE_NAME,
+                    rng.integers(1, 10_000),
+                    coverage,
+                    total_time,
+                    search_time,
+                    len(lines),
+                    rng.uniform(0, coverage),
+                    *coverage_timeline.round(6),
+                )
+            )
+
+    if return_code == 0:
+        with open(os.path.join(run_path, f"test_{SYNTHETIC_MODULE_NAME}.py"), "w") as f:
+            f.write(f"import {SYNTHETIC_MODULE_NAME} as module_0\n")
+
+        write_coverage_report(run_path, module_path, lines, executed)
+
+        with open(os.path.join(run_path, "coverage_time"), "w") as f:
+            f.write(f"{int(rng.uniform(1, 20) * NANOSECONDS_IN_SECOND)}")
+
+    for i in range(rng.poisson(0.3)):
+        with open(os.path.join(run_path, f"crash_test_{i}.py"), "w") as f:
+            f.write(f"import {SYNTHETIC_MODULE_NAME} as module_0\n")
+
+    wall_time = total_time + int(rng.uniform(1, 5) * NANOSECONDS_IN_SECOND)
+    peak_rss = int(rng.uniform(200, 2000) * BYTES_IN_MEBIBYTE)
+
+    with open(os.path.join(run_path, "telemetry.json"), "w") as f:
+        json.dump(
+            {
+                "wall_time": wall_time,
+                "user_time": wall_time * rng.uniform(0.5, 1) / NANOSECONDS_IN_SECOND,
+                "system_time": wall_time * 0.05 / NANOSECONDS_IN_SECOND,
+                "peak_rss": peak_rss,
+                "memory_timeline": [
+                    [wall_time * i // 16, peak_rss * (i + 1) // 16] for i in range(16)
+                ],
+            },
+            f,
+        )
+
+    with open(os.path.join(run_path, "return_code"), "w") as f:
+        f.write(f"{return_code}")
+
+    for stage in ("pynguin", "coverage"):
+        with open(os.path.join(run_path, f"{stage}_done"), "w") as f:
+            f.write("0")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output_path")
+    parser.add_argument("--nb-experiments", type=int, default=10)
+    parser.add_argument("--nb-runs", type=int, default=30)
+    parser.add_argument("--nb-lines", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    project_path = os.path.join(args.output_path, "project")
+    results_path = os.path.join(args.output_path, "results")
+
+    module_path = write_synthetic_module(project_path, args.nb_lines)
+
+    with open(module_path, "r") as f:
+        lines = np.array(sorted(get_lines(ast.parse(f.read()))), dtype=np.int64)
+
+    function_indexes = (lines - 1) // FUNCTION_SIZE
+    nb_functions = function_indexes[-1] + 1
+
+    experiment_names = [f"experiment_{i}" for i in range(args.nb_experiments)]
+
+    for experiment_name in experiment_names:
+        print(f"{experiment_name} : Writing {args.nb_runs} runs")
+
+        function_probabilities = rng.beta(2, 1, nb_functions) * rng.uniform(0.5, 1)
+
+        for i in range(args.nb_runs):
+            write_run(
+                rng,
+                os.path.join(results_path, experiment_name, str(i)),
+                os.path.abspath(module_path),
+                lines,
+                function_indexes,
+                function_probabilities,
+            )
+
+    with open(os.path.join(args.output_path, "modules.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        for experiment_name in experiment_names:
+            writer.writerow(
+                (
+                    SYNTHETIC_MODULE_NAME,
+                    experiment_name,
+                    "main",
+                    MAXIMUM_SEARCH_TIME,
+                    TIMEOUT,
+                    "",
+                )
+            )
+
+    with open(os.path.join(args.output_path, SYNTHETIC_RESULTS_NAME), "w") as f:
+        json.dump(
+            {
+                "nb_experiments": args.nb_experiments,
+                "nb_runs": args.nb_runs,
+                "nb_lines": len(lines),
+                "seed": args.seed,
+                "experiment_names": experiment_names,
+            },
+            f,
+            indent=4,
+        )
+
+
+if __name__ == "__main__":
+    main()
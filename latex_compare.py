@@ -1,4 +1,5 @@
 from utils import load_summary, get_coverages, compare_distributions
+from utils import add_cache_arguments, configure_cache
 from pylatex import NoEscape
 import argparse
 
@@ -8,8 +9,12 @@ def main() -> None:
     parser.add_argument("first_experiment")
     parser.add_argument("second_experiment")
 
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
 
+    configure_cache(args)
+
     first_summary = load_summary(args.first_experiment)
     second_summary = load_summary(args.second_experiment)
 
@@ -1,21 +1,34 @@
 from utils import load_summary
+from utils import add_cache_arguments, configure_cache
 from pylatex import Tabular
 import argparse
 
 
+BYTES_IN_MEBIBYTE = 1024 * 1024
+
+
 HEADER = (
     "Experiment",
     "Coverage",
+    "Coverage AUC",
     "Iterations",
     "Total time",
     "Search time",
+    "Wall time",
+    "Startup time",
     "Mutation score",
     "Crash test count",
+    "Unique crash count",
+    "Mean peak memory",
+    "Max peak memory",
+    "Mean CPU utilisation",
+    "Max CPU utilisation",
     "Success",
     "Failure",
     "Timeout",
     "Segmentation fault",
     "Out of memory",
+    "Limit hit",
     "Floating point exception",
     "Other crashes",
 )
@@ -30,6 +43,7 @@ def create_table(summaries: list[dict]) -> list[tuple]:
         timeout_count = return_code_counter.pop("null", 0)
         segmentation_fault_count = return_code_counter.pop("-11", 0)
         out_of_memory_count = return_code_counter.pop("-9", 0)
+        limit_hit_count = return_code_counter.pop("limit", 0)
         floating_point_exception_count = return_code_counter.pop("-8", 0)
         other_crashes_count = sum(return_code_counter.values())
 
@@ -37,16 +51,25 @@ def create_table(summaries: list[dict]) -> list[tuple]:
             (
                 summary["experiment_name"],
                 f'{summary["mean_coverage"]:.2f}',
+                f'{summary.get("mean_coverage_auc", 0):.2f}',
                 f'{summary["mean_iterations"]:.2f}',
                 f'{summary["mean_total_time"]:.2f}',
                 f'{summary["mean_search_time"]:.2f}',
+                f'{summary.get("mean_wall_time", 0):.2f}',
+                f'{summary.get("mean_startup_time", 0):.2f}',
                 f'{summary["mean_mutation_score"]:.2f}',
                 str(summary["crash_test_count"]),
+                str(summary.get("unique_crash_count", 0)),
+                f'{summary.get("mean_peak_rss", 0) / BYTES_IN_MEBIBYTE:.0f} MiB',
+                f'{summary.get("max_peak_rss", 0) / BYTES_IN_MEBIBYTE:.0f} MiB',
+                f'{summary.get("mean_cpu_utilisation", 0):.2f}',
+                f'{summary.get("max_cpu_utilisation", 0):.2f}',
                 str(success_count),
                 str(failure_count),
                 str(timeout_count),
                 str(segmentation_fault_count),
                 str(out_of_memory_count),
+                str(limit_hit_count),
                 str(floating_point_exception_count),
                 str(other_crashes_count),
             )
@@ -60,8 +83,12 @@ def main() -> None:
     parser.add_argument("--except_columns")
     parser.add_argument("experiments", nargs="+")
 
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
 
+    configure_cache(args)
+
     data = create_table(list(map(load_summary, args.experiments)))
 
     if args.except_columns is not None:
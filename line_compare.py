@@ -1,42 +1,89 @@
-from utils import load_summary, compare_distributions
+from utils import (
+    load_line_hits,
+    align_line_hit_counts,
+    compare_line_hit_counts,
+    adjust_p_values,
+)
+import numpy as np
 import argparse
+import csv
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--correction",
+        choices=("none", "bonferroni", "holm", "benjamini-hochberg"),
+        default="benjamini-hochberg",
+    )
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--output")
     parser.add_argument("first_experiment")
     parser.add_argument("second_experiment")
 
     args = parser.parse_args()
 
-    first_summary = load_summary(args.first_experiment)
-    second_summary = load_summary(args.second_experiment)
+    first_line_numbers, first_line_hits = load_line_hits(args.first_experiment)
+    second_line_numbers, second_line_hits = load_line_hits(args.second_experiment)
 
-    first_executed_lines_counter: dict = first_summary["executed_lines_counter"]
-    second_executed_lines_counter: dict = second_summary["executed_lines_counter"]
+    lines, (first_counts, second_counts) = align_line_hit_counts(
+        [first_line_numbers, second_line_numbers],
+        [first_line_hits, second_line_hits],
+    )
 
-    lines = sorted(
-        first_executed_lines_counter.keys() | second_executed_lines_counter.keys(),
-        key=lambda line: int(line),
+    u_statistics, p_values, a12s, differences = compare_line_hit_counts(
+        first_counts, len(first_line_hits), second_counts, len(second_line_hits)
     )
 
-    for line in lines:
-        first_count = first_executed_lines_counter[line]
-        second_count = second_executed_lines_counter[line]
+    adjusted_p_values = adjust_p_values(p_values, args.correction)
 
-        first_distribution = [True] * first_count + [False] * (
-            first_summary["nb_runs"] - first_count
-        )
-        second_distribution = [True] * second_count + [False] * (
-            second_summary["nb_runs"] - second_count
+    for line, u_statistic, p_value, adjusted_p_value, a12, difference in zip(
+        lines.tolist(),
+        u_statistics.tolist(),
+        p_values.tolist(),
+        adjusted_p_values.tolist(),
+        a12s.tolist(),
+        differences.tolist(),
+    ):
+        print(
+            f"Line {line:<4} Mann–Whitney U-test: {u_statistic:.2f} (pvalue: {p_value:.2f}, adjusted: {adjusted_p_value:.2f}) / Vargha-Delaney A statistic: {a12:.2f} ({difference})"
         )
 
-        u_statistic, p_value, a12, difference = compare_distributions(
-            first_distribution, second_distribution
+    if args.output is None:
+        return
+
+    significant = np.flatnonzero(adjusted_p_values < args.alpha)
+    significant = significant[
+        np.lexsort(
+            (-np.abs(a12s[significant] - 0.5), adjusted_p_values[significant])
         )
+    ]
 
-        print(
-            f"Line {line:<4} Mann–Whitney U-test: {u_statistic:.2f} (pvalue: {p_value:.2f}) / Vargha-Delaney A statistic: {a12:.2f} ({difference})"
+    with open(args.output, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            (
+                "line",
+                "first_hits",
+                "second_hits",
+                "u_statistic",
+                "p_value",
+                "adjusted_p_value",
+                "a12",
+                "difference",
+            )
+        )
+        writer.writerows(
+            zip(
+                lines[significant].tolist(),
+                first_counts[significant].tolist(),
+                second_counts[significant].tolist(),
+                u_statistics[significant].tolist(),
+                p_values[significant].tolist(),
+                adjusted_p_values[significant].tolist(),
+                a12s[significant].tolist(),
+                differences[significant].tolist(),
+            )
         )
 
 
@@ -1,75 +1,187 @@
 import matplotlib.pyplot as plt
-from utils import load_summary
-from functools import reduce
-import operator
+from utils import load_summary, load_line_hits, align_line_hit_count
+from utils import add_cache_arguments, configure_cache
+import numpy as np
 import argparse
+import math
 
 
-def load_experiment(experiment_path: str) -> tuple[str, int, dict]:
+MAX_BLOCKS = 100
+
+MAX_HEATMAP_COLUMNS = 4096
+
+MAX_TITLE_EXPERIMENTS = 5
+
+
+def load_experiment(experiment_path: str) -> tuple[str, np.ndarray, np.ndarray]:
     summary = load_summary(experiment_path)
+    line_numbers, line_hits = load_line_hits(experiment_path)
     return (
         summary["experiment_name"],
-        summary["nb_runs"],
-        summary["executed_lines_counter"],
+        line_numbers,
+        line_hits,
     )
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--no-interactive", action="store_true")
-    parser.add_argument("experiments", nargs="+")
+def get_block_size(nb_lines: int, mode: str, block_size: int | None) -> int:
+    if mode == "bars":
+        return 1
 
-    args = parser.parse_args()
+    if block_size is not None:
+        return block_size
 
-    all_experiment_name, all_nb_runs, all_executed_lines_counter = zip(
-        *(load_experiment(experiment_path) for experiment_path in args.experiments)
-    )
+    if mode == "blocks":
+        return max(1, math.ceil(nb_lines / MAX_BLOCKS))
 
-    total_nb_runs = sum(all_nb_runs)
-
-    lines = sorted(
-        reduce(
-            operator.or_,
-            (
-                executed_lines_counter.keys()
-                for executed_lines_counter in all_executed_lines_counter
-            ),
-        ),
-        key=lambda line: int(line),
-    )
+    return max(1, math.ceil(nb_lines / MAX_HEATMAP_COLUMNS))
+
+
+def get_block_hit_frequencies(
+    lines: np.ndarray,
+    all_line_numbers: list[np.ndarray],
+    all_line_hits: list[np.ndarray],
+    block_starts: np.ndarray,
+    normalize_per_experiment: bool,
+) -> np.ndarray:
+    block_lengths = np.diff(block_starts, append=len(lines))
+
+    total_nb_runs = sum(len(line_hits) for line_hits in all_line_hits)
+
+    block_hit_frequencies = np.empty((len(all_line_hits), len(block_starts)))
+    for i, (line_numbers, line_hits) in enumerate(zip(all_line_numbers, all_line_hits)):
+        counts = align_line_hit_count(lines, line_numbers, line_hits)
+
+        nb_runs = len(line_hits) if normalize_per_experiment else total_nb_runs
 
+        block_hit_frequencies[i] = np.add.reduceat(counts, block_starts) / (
+            block_lengths * nb_runs
+        )
+
+    return block_hit_frequencies
+
+
+def plot_stacked_bars(
+    experiment_names: list[str], labels: list[str], block_hit_frequencies: np.ndarray
+) -> plt.Figure:
     fig, ax = plt.subplots(figsize=(5, 10))
 
-    left = [0] * len(lines)
-    for experiment_name, executed_lines_counter in zip(
-        all_experiment_name, all_executed_lines_counter
+    lefts = np.cumsum(block_hit_frequencies, axis=0) - block_hit_frequencies
+    for experiment_name, frequencies, left in zip(
+        experiment_names, block_hit_frequencies, lefts
     ):
-        sorted_line_hit_frequencies = [
-            executed_lines_counter[line] / total_nb_runs for line in lines
-        ]
         ax.barh(
-            lines,
-            sorted_line_hit_frequencies,
+            labels,
+            frequencies,
             label=experiment_name,
             left=left,
         )
-        left = [sum(x) for x in zip(left, sorted_line_hit_frequencies)]
 
     ax.set_ylabel("Line number")
     ax.set_xlabel("Line hit frequency")
-    ax.set_ylim((len(lines) * len(all_experiment_name)) / -20, len(lines) + 5)
+    ax.set_ylim((len(labels) * len(experiment_names)) / -20, len(labels) + 5)
     ax.invert_yaxis()
 
-    experiment_names = " and ".join(all_experiment_name)
+    plt.xticks([0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1])
+    plt.yticks(range(0, len(labels), max(1, len(labels) // 25)))
+    plt.legend(loc="upper right")
+
+    return fig
+
+
+def plot_heatmap(
+    experiment_names: list[str], labels: list[str], block_hit_frequencies: np.ndarray
+) -> plt.Figure:
+    fig, ax = plt.subplots(figsize=(10, min(10, 2 + len(experiment_names) / 4)))
+
+    image = ax.imshow(
+        block_hit_frequencies,
+        aspect="auto",
+        interpolation="nearest",
+        vmin=0,
+        vmax=1,
+        rasterized=True,
+    )
+
+    experiment_step = max(1, len(experiment_names) // 50)
+    ax.set_yticks(
+        range(0, len(experiment_names), experiment_step),
+        experiment_names[::experiment_step],
+    )
+
+    label_positions = np.linspace(0, len(labels) - 1, min(len(labels), 10)).astype(int)
+    ax.set_xticks(label_positions, [labels[position] for position in label_positions])
+
+    ax.set_xlabel("Line number")
+    ax.set_ylabel("Experiment")
+
+    fig.colorbar(image, ax=ax, label="Line hit frequency")
+
+    return fig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--no-interactive", action="store_true")
+    parser.add_argument(
+        "--mode", choices=("bars", "blocks", "heatmap"), default="bars"
+    )
+    parser.add_argument("--block-size", type=int)
+    parser.add_argument("experiments", nargs="+")
+
+    add_cache_arguments(parser)
+
+    args = parser.parse_args()
+
+    configure_cache(args)
+
+    if args.block_size is not None and args.block_size < 1:
+        parser.error("--block-size must be at least 1")
+
+    all_experiment_name, all_line_numbers, all_line_hits = zip(
+        *(load_experiment(experiment_path) for experiment_path in args.experiments)
+    )
+
+    lines = np.unique(np.concatenate(all_line_numbers))
+
+    block_size = get_block_size(len(lines), args.mode, args.block_size)
+
+    block_starts = np.arange(0, len(lines), block_size)
+
+    block_hit_frequencies = get_block_hit_frequencies(
+        lines,
+        all_line_numbers,
+        all_line_hits,
+        block_starts,
+        args.mode == "heatmap",
+    )
+
+    if block_size == 1 or args.mode == "heatmap":
+        labels = [str(line) for line in lines[block_starts].tolist()]
+    else:
+        block_ends = np.minimum(block_starts + block_size, len(lines)) - 1
+        labels = [
+            f"{first_line}-{last_line}"
+            for first_line, last_line in zip(
+                lines[block_starts].tolist(), lines[block_ends].tolist()
+            )
+        ]
+
+    if args.mode == "heatmap":
+        fig = plot_heatmap(list(all_experiment_name), labels, block_hit_frequencies)
+    else:
+        fig = plot_stacked_bars(
+            list(all_experiment_name), labels, block_hit_frequencies
+        )
+
+    if len(all_experiment_name) > MAX_TITLE_EXPERIMENTS:
+        experiment_names = f"{len(all_experiment_name)} experiments"
+    else:
+        experiment_names = " and ".join(all_experiment_name)
 
     title = f"Line hit frequency of {experiment_names}"
 
     fig.canvas.manager.set_window_title(title)
 
-    plt.xticks([0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1])
-    plt.yticks(range(0, len(lines), len(lines) // 25))
-    plt.legend(loc="upper right")
-
     if args.no_interactive:
         plt.savefig(
             title.replace(" ", "_") + ".png",
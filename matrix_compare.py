@@ -0,0 +1,180 @@
+from utils import load_summary, get_run_statistics, get_differences
+from utils import add_cache_arguments, configure_cache
+from utils import RUN_STATISTICS
+from scipy.stats import mannwhitneyu
+from pylatex import Tabular, NoEscape
+import numpy as np
+import argparse
+import csv
+
+
+NANOSECONDS_IN_SECOND = 1_000_000_000
+
+METRIC_NAMES = {
+    "coverage": "Coverage",
+    "mutation_score": "Mutation score",
+    "iterations": "Iterations",
+    "total_time": "Total time",
+    "search_time": "Search time",
+}
+
+TIME_METRICS = ("total_time", "search_time")
+
+
+def compare_all_pairs(
+    distributions: list[np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    nb_experiments = len(distributions)
+
+    if len({len(distribution) for distribution in distributions}) == 1:
+        samples = np.stack(distributions)
+
+        u_statistics, p_values = mannwhitneyu(
+            samples[:, np.newaxis, :],
+            samples[np.newaxis, :, :],
+            alternative="two-sided",
+            axis=-1,
+        )
+    else:
+        u_statistics = np.zeros((nb_experiments, nb_experiments))
+        p_values = np.ones((nb_experiments, nb_experiments))
+        for i in range(nb_experiments):
+            for j in range(i + 1, nb_experiments):
+                u_statistic, p_value = mannwhitneyu(
+                    distributions[i], distributions[j], alternative="two-sided"
+                )
+                u_statistics[i, j] = u_statistic
+                u_statistics[j, i] = (
+                    len(distributions[i]) * len(distributions[j]) - u_statistic
+                )
+                p_values[i, j] = p_values[j, i] = p_value
+
+    sizes = np.array([len(distribution) for distribution in distributions])
+
+    a12s = u_statistics / np.outer(sizes, sizes)
+
+    np.fill_diagonal(p_values, 1.0)
+    np.fill_diagonal(a12s, 0.5)
+
+    return u_statistics, np.nan_to_num(p_values, nan=1.0), a12s
+
+
+def create_latex_matrix(
+    experiment_names: list[str], p_values: np.ndarray, a12s: np.ndarray
+) -> Tabular:
+    latex_table = Tabular(f'|{" c |" * (len(experiment_names) + 1)}')
+    latex_table.add_hline()
+    latex_table.add_row(("", *experiment_names))
+    latex_table.add_hline()
+    for i, experiment_name in enumerate(experiment_names):
+        cells = []
+        for j in range(len(experiment_names)):
+            if i == j:
+                cells.append("-")
+                continue
+
+            if p_values[i, j] < 0.05:
+                color = "\\cellcolor{gray!25}"
+            else:
+                color = ""
+
+            if p_values[i, j] < 0.01:
+                p_value_str = "<0.01"
+            else:
+                p_value_str = f"{p_values[i, j]:.2f}"
+
+            cells.append(NoEscape(f"{color}{a12s[i, j]:.2f} ({p_value_str})"))
+
+        latex_table.add_row((experiment_name, *cells))
+        latex_table.add_hline()
+
+    return latex_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output-prefix", default="comparison_matrix")
+    parser.add_argument("experiments", nargs="+")
+
+    add_cache_arguments(parser)
+
+    args = parser.parse_args()
+
+    configure_cache(args)
+
+    summaries = [load_summary(experiment) for experiment in args.experiments]
+
+    experiment_names = [summary["experiment_name"] for summary in summaries]
+
+    all_run_statistics = [
+        get_run_statistics(experiment, summary["nb_runs"])
+        for experiment, summary in zip(args.experiments, summaries)
+    ]
+
+    rows = []
+    latex_tables = []
+    for key, _ in RUN_STATISTICS:
+        distributions = [
+            run_statistics[key] for run_statistics in all_run_statistics
+        ]
+
+        u_statistics, p_values, a12s = compare_all_pairs(distributions)
+
+        differences = get_differences(a12s)
+
+        if key in TIME_METRICS:
+            means = [
+                distribution.mean() / NANOSECONDS_IN_SECOND
+                for distribution in distributions
+            ]
+        else:
+            means = [distribution.mean() for distribution in distributions]
+
+        for i, first_name in enumerate(experiment_names):
+            for j, second_name in enumerate(experiment_names):
+                if i == j:
+                    continue
+
+                rows.append(
+                    (
+                        key,
+                        first_name,
+                        second_name,
+                        means[i],
+                        means[j],
+                        u_statistics[i, j],
+                        p_values[i, j],
+                        a12s[i, j],
+                        differences[i, j],
+                    )
+                )
+
+        latex_tables.append(
+            f"% {METRIC_NAMES[key]}\n"
+            + create_latex_matrix(experiment_names, p_values, a12s).dumps()
+        )
+
+    with open(f"{args.output_prefix}.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            (
+                "metric",
+                "first_experiment",
+                "second_experiment",
+                "first_mean",
+                "second_mean",
+                "u_statistic",
+                "p_value",
+                "a12",
+                "difference",
+            )
+        )
+        writer.writerows(rows)
+
+    with open(f"{args.output_prefix}.tex", "w") as f:
+        f.write("\n\n".join(latex_tables))
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+from utils import compare_distributions
+from profiles import COLLAPSED_PROFILE_NAME, PROFILE_CATEGORIES
+from profiles import load_run_profile, read_collapsed_profile
+from profiles import get_category_shares, get_function_shares
+from collections import Counter
+import numpy as np
+import argparse
+import os
+
+
+def get_run_category_shares(experiment_path: str) -> dict[str, np.ndarray]:
+    run_category_shares = {category: [] for category in PROFILE_CATEGORIES}
+    for name in sorted(os.listdir(experiment_path)):
+        if not name.isdigit():
+            continue
+
+        stacks = load_run_profile(os.path.join(experiment_path, name))
+
+        if stacks is None:
+            continue
+
+        for category, share in get_category_shares(stacks).items():
+            run_category_shares[category].append(share)
+
+    return {
+        category: np.array(shares) for category, shares in run_category_shares.items()
+    }
+
+
+def write_differential_profile(
+    path: str, first_stacks: Counter, second_stacks: Counter
+) -> None:
+    with open(path, "w") as f:
+        for stack in sorted(first_stacks.keys() | second_stacks.keys()):
+            f.write(f"{stack} {first_stacks[stack]} {second_stacks[stack]}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("first_experiment")
+    parser.add_argument("second_experiment")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--output", default=None)
+
+    args = parser.parse_args()
+
+    first_category_shares = get_run_category_shares(args.first_experiment)
+    second_category_shares = get_run_category_shares(args.second_experiment)
+
+    for category in PROFILE_CATEGORIES:
+        first_shares = first_category_shares[category]
+        second_shares = second_category_shares[category]
+
+        if len(first_shares) == 0 or len(second_shares) == 0:
+            continue
+
+        u_statistic, p_value, a12, difference = compare_distributions(
+            first_shares, second_shares
+        )
+
+        first_median = f"{np.median(first_shares):.2%}"
+        second_median = f"{np.median(second_shares):.2%}"
+
+        print(f"{category:<30}: {first_median:<35} {second_median:<35}")
+        print(
+            f"{'  Mann–Whitney U-test':<30}: {u_statistic:.2f} (pvalue: {p_value:.2f})"
+        )
+        print(f"{'  Vargha-Delaney A statistic':<30}: {difference} ({a12:.2f})")
+
+    first_stacks = read_collapsed_profile(
+        os.path.join(args.first_experiment, COLLAPSED_PROFILE_NAME)
+    )
+    second_stacks = read_collapsed_profile(
+        os.path.join(args.second_experiment, COLLAPSED_PROFILE_NAME)
+    )
+
+    first_self_shares, first_inclusive_shares = get_function_shares(first_stacks)
+    second_self_shares, second_inclusive_shares = get_function_shares(second_stacks)
+
+    for title, first_shares, second_shares in (
+        ("Self time", first_self_shares, second_self_shares),
+        ("Inclusive time", first_inclusive_shares, second_inclusive_shares),
+    ):
+        print()
+        print(f"{title:<16}{'First':>9}{'Second':>9}{'Change':>9}  Function")
+
+        frames = sorted(
+            first_shares.keys() | second_shares.keys(),
+            key=lambda frame: -abs(second_shares[frame] - first_shares[frame]),
+        )
+
+        for frame in frames[: args.top]:
+            print(
+                f"{'':<16}{first_shares[frame]:>9.2%}{second_shares[frame]:>9.2%}{second_shares[frame] - first_shares[frame]:>+9.2%}  {frame}"
+            )
+
+    if args.output is not None:
+        write_differential_profile(args.output, first_stacks, second_stacks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+from collections import Counter
+import subprocess
+import pstats
+import shutil
+import json
+import re
+import os
+
+
+PROFILERS = ("cprofile", "py-spy")
+
+PSTATS_NAME = "profile.pstats"
+
+COLLAPSED_PROFILE_NAME = "profile.collapsed"
+
+PROFILE_REPORT_NAME = "profile_report.json"
+
+PY_SPY_RATE = 100
+
+PROFILER_STOP_TIMEOUT = 60
+
+PSTATS_TIME_UNIT = 1_000_000
+
+PSTATS_MINIMUM_SHARE = 1e-4
+
+PSTATS_MAXIMUM_DEPTH = 256
+
+PROFILE_REPORT_SIZE = 50
+
+PROFILE_CATEGORIES = {
+    "test execution": "pynguin/testcase/execution",
+    "tensor_fuzzer": "tensor_fuzzer",
+    "assertion generation": "pynguin/assertion",
+    "subprocess IPC": "multiprocess",
+    "search": "pynguin/ga",
+}
+
+CPROFILE_RUNNER = """
+import cProfile
+import signal
+import runpy
+import sys
+
+output_path = sys.argv[1]
+sys.argv = sys.argv[2:]
+
+signal.signal(signal.SIGTERM, lambda *_: sys.exit(128 + signal.SIGTERM))
+
+profile = cProfile.Profile()
+try:
+    profile.runcall(runpy.run_path, sys.argv[0], run_name="__main__")
+finally:
+    profile.dump_stats(output_path)
+"""
+
+PACKAGE_PATH_MARKERS = ("site-packages/", "/worktree/")
+
+PROCESS_FRAME = re.compile(r'^process \d+:".*"$')
+
+FRAME_FILE = re.compile(r"^(?P<function>.*) \((?P<file>[^()]*)\)$")
+
+
+def get_cprofile_argv(python_executable: str, run_path: str) -> list[str]:
+    return [
+        python_executable,
+        "-c",
+        CPROFILE_RUNNER,
+        os.path.join(run_path, PSTATS_NAME),
+    ]
+
+
+def start_py_spy(pid: int, run_path: str) -> subprocess.Popen | None:
+    py_spy_path = shutil.which("py-spy")
+
+    if py_spy_path is None:
+        return None
+
+    with open(os.path.join(run_path, "profiler.log"), "w") as log_file:
+        return subprocess.Popen(
+            [
+                py_spy_path,
+                "record",
+                "--pid",
+                str(pid),
+                "--rate",
+                str(PY_SPY_RATE),
+                "--format",
+                "raw",
+                "--nolineno",
+                "--subprocesses",
+                "--nonblocking",
+                "--output",
+                os.path.join(run_path, COLLAPSED_PROFILE_NAME),
+            ],
+            stdout=log_file,
+            stderr=log_file,
+        )
+
+
+def stop_py_spy(process: subprocess.Popen | None) -> None:
+    if process is None:
+        return
+
+    try:
+        process.wait(PROFILER_STOP_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.terminate()
+        process.wait()
+
+
+def normalize_file(file: str) -> str:
+    for marker in PACKAGE_PATH_MARKERS:
+        if marker in file:
+            return file.rsplit(marker, 1)[1]
+
+    match = re.search(r"/lib/python3\.\d+/(.*)$", file)
+
+    if match is not None:
+        return match[1]
+
+    return os.path.basename(file)
+
+
+def normalize_frame(frame: str) -> str | None:
+    if PROCESS_FRAME.match(frame):
+        return None
+
+    match = FRAME_FILE.match(frame)
+
+    if match is None:
+        return frame
+
+    return f'{match["function"]} ({normalize_file(match["file"])})'
+
+
+def get_pstats_frame(function: tuple[str, int, str]) -> str:
+    file, _, name = function
+
+    if file == "~":
+        return name
+
+    return f"{name} ({normalize_file(file)})"
+
+
+def get_pstats_stacks(stats: dict) -> Counter:
+    callees: dict[tuple, dict[tuple, float]] = {}
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_cumulative_time) in callers.items():
+            callees.setdefault(caller, {})[function] = edge_cumulative_time
+
+    roots = [
+        function
+        for function, (_, _, _, _, callers) in stats.items()
+        if not callers or all(caller not in stats for caller in callers)
+    ]
+
+    if stats:
+        top_function = max(stats, key=lambda function: stats[function][3])
+
+        if top_function not in roots:
+            roots.append(top_function)
+
+    minimum_time = PSTATS_MINIMUM_SHARE * sum(stats[function][3] for function in roots)
+
+    stacks = Counter()
+    pending = [((function,), stats[function][3]) for function in roots]
+    while pending:
+        path, time = pending.pop()
+
+        function = path[-1]
+        _, _, total_time, cumulative_time, _ = stats[function]
+
+        if cumulative_time <= 0 or time < minimum_time:
+            continue
+
+        ratio = min(1.0, time / cumulative_time)
+
+        self_time = int(total_time * ratio * PSTATS_TIME_UNIT)
+
+        if self_time > 0:
+            stacks[";".join(map(get_pstats_frame, path))] += self_time
+
+        if len(path) >= PSTATS_MAXIMUM_DEPTH:
+            continue
+
+        for callee, edge_cumulative_time in callees.get(function, {}).items():
+            if callee not in path:
+                pending.append(((*path, callee), edge_cumulative_time * ratio))
+
+    return stacks
+
+
+def read_collapsed_profile(path: str) -> Counter:
+    stacks = Counter()
+    with open(path, "r", errors="replace") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+
+            if not stack or not count.isdigit():
+                continue
+
+            frames = [
+                frame
+                for frame in map(normalize_frame, stack.split(";"))
+                if frame is not None
+            ]
+
+            if frames:
+                stacks[";".join(frames)] += int(count)
+
+    return stacks
+
+
+def write_collapsed_profile(path: str, stacks: Counter) -> None:
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary_path, "w") as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+    os.replace(temporary_path, path)
+
+
+def write_run_profile(run_path: str) -> None:
+    pstats_path = os.path.join(run_path, PSTATS_NAME)
+    collapsed_path = os.path.join(run_path, COLLAPSED_PROFILE_NAME)
+
+    if not os.path.exists(pstats_path) or os.path.exists(collapsed_path):
+        return
+
+    try:
+        stats = pstats.Stats(pstats_path).stats
+    except (OSError, EOFError, ValueError, TypeError):
+        return
+
+    write_collapsed_profile(collapsed_path, get_pstats_stacks(stats))
+
+
+def load_run_profile(run_path: str) -> Counter | None:
+    try:
+        return read_collapsed_profile(os.path.join(run_path, COLLAPSED_PROFILE_NAME))
+    except FileNotFoundError:
+        return None
+
+
+def get_category_shares(stacks: Counter) -> dict[str, float]:
+    total = sum(stacks.values())
+
+    category_times = Counter({category: 0 for category in PROFILE_CATEGORIES})
+    for stack, count in stacks.items():
+        for category, pattern in PROFILE_CATEGORIES.items():
+            if pattern in stack:
+                category_times[category] += count
+
+    return {
+        category: time / total if total > 0 else 0.0
+        for category, time in category_times.items()
+    }
+
+
+def get_function_shares(stacks: Counter) -> tuple[Counter, Counter]:
+    total = sum(stacks.values())
+
+    self_times = Counter()
+    inclusive_times = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        self_times[frames[-1]] += count
+
+        for frame in set(frames):
+            inclusive_times[frame] += count
+
+    if total == 0:
+        return Counter(), Counter()
+
+    return (
+        Counter({frame: time / total for frame, time in self_times.items()}),
+        Counter({frame: time / total for frame, time in inclusive_times.items()}),
+    )
+
+
+def write_experiment_profile(experiment_path: str, run_paths: list[str]) -> dict:
+    stacks = Counter()
+    nb_profiled_runs = 0
+    for run_path in run_paths:
+        run_stacks = load_run_profile(run_path)
+
+        if run_stacks is None:
+            continue
+
+        stacks.update(run_stacks)
+        nb_profiled_runs += 1
+
+    if nb_profiled_runs == 0:
+        return {}
+
+    write_collapsed_profile(
+        os.path.join(experiment_path, COLLAPSED_PROFILE_NAME), stacks
+    )
+
+    self_shares, inclusive_shares = get_function_shares(stacks)
+    category_shares = get_category_shares(stacks)
+
+    with open(os.path.join(experiment_path, PROFILE_REPORT_NAME), "w") as f:
+        json.dump(
+            {
+                "nb_profiled_runs": nb_profiled_runs,
+                "category_shares": category_shares,
+                "self_shares": self_shares.most_common(PROFILE_REPORT_SIZE),
+                "inclusive_shares": inclusive_shares.most_common(PROFILE_REPORT_SIZE),
+            },
+            f,
+            indent=4,
+        )
+
+    return {
+        "nb_profiled_runs": nb_profiled_runs,
+        "profile_category_shares": category_shares,
+    }
@@ -0,0 +1,188 @@
+from typing import Callable
+import itertools
+import functools
+import resource
+import signal
+import time
+import os
+
+
+BYTES_IN_MEBIBYTE = 1024 * 1024
+
+RESOURCE_LIMIT_NAMES = ("memory", "cpu_time", "open_files", "processes")
+
+CPU_TIME_GRACE_PERIOD = 5
+
+CGROUP_ROOT_PATH = "/sys/fs/cgroup"
+
+CGROUP_REMOVE_ATTEMPTS = 50
+
+CGROUP_COUNTER = itertools.count()
+
+
+def parse_resource_limits(resource_limits: str) -> dict[str, int]:
+    limits = {}
+    for limit in resource_limits.split():
+        name, _, value = limit.partition("=")
+
+        if name not in RESOURCE_LIMIT_NAMES:
+            raise ValueError(f'Unknown resource limit "{name}"')
+
+        limits[name] = int(value)
+
+    return limits
+
+
+def write_cgroup_file(cgroup_path: str, name: str, value: str) -> None:
+    with open(os.path.join(cgroup_path, name), "w") as f:
+        f.write(value)
+
+
+def read_cgroup_events(cgroup_path: str, name: str) -> dict[str, int]:
+    try:
+        with open(os.path.join(cgroup_path, name), "r") as f:
+            return {key: int(value) for key, value in (line.split() for line in f)}
+    except OSError:
+        return {}
+
+
+@functools.cache
+def get_cgroup_parent_path() -> str | None:
+    if not os.path.exists(os.path.join(CGROUP_ROOT_PATH, "cgroup.controllers")):
+        return None
+
+    try:
+        with open("/proc/self/cgroup", "r") as f:
+            (cgroup,) = (line[3:].strip() for line in f if line.startswith("0::"))
+
+        cgroup_path = os.path.join(CGROUP_ROOT_PATH, cgroup.lstrip("/"))
+
+        orchestrator_path = os.path.join(cgroup_path, "orchestrator")
+        os.makedirs(orchestrator_path, exist_ok=True)
+        write_cgroup_file(orchestrator_path, "cgroup.procs", str(os.getpid()))
+
+        write_cgroup_file(cgroup_path, "cgroup.subtree_control", "+memory +pids")
+    except (OSError, ValueError):
+        return None
+
+    return cgroup_path
+
+
+def get_rlimits(
+    limits: dict[str, int], use_cgroup: bool
+) -> list[tuple[int, tuple[int, int]]]:
+    rlimits = []
+
+    if "memory" in limits and not use_cgroup:
+        memory = limits["memory"] * BYTES_IN_MEBIBYTE
+        rlimits.append((resource.RLIMIT_AS, (memory, memory)))
+
+    if "cpu_time" in limits:
+        rlimits.append(
+            (
+                resource.RLIMIT_CPU,
+                (limits["cpu_time"], limits["cpu_time"] + CPU_TIME_GRACE_PERIOD),
+            )
+        )
+
+    if "open_files" in limits:
+        rlimits.append(
+            (resource.RLIMIT_NOFILE, (limits["open_files"], limits["open_files"]))
+        )
+
+    return rlimits
+
+
+def create_cgroup(limits: dict[str, int], name: str) -> str | None:
+    if not limits:
+        return None
+
+    cgroup_parent_path = get_cgroup_parent_path()
+
+    if cgroup_parent_path is None:
+        return None
+
+    cgroup_path = os.path.join(
+        cgroup_parent_path, f"{name}-{os.getpid()}-{next(CGROUP_COUNTER)}"
+    )
+
+    try:
+        os.makedirs(cgroup_path)
+
+        if "memory" in limits:
+            write_cgroup_file(
+                cgroup_path, "memory.max", str(limits["memory"] * BYTES_IN_MEBIBYTE)
+            )
+
+            if os.path.exists(os.path.join(cgroup_path, "memory.swap.max")):
+                write_cgroup_file(cgroup_path, "memory.swap.max", "0")
+
+        if "processes" in limits:
+            write_cgroup_file(cgroup_path, "pids.max", str(limits["processes"]))
+    except OSError:
+        remove_cgroup(cgroup_path)
+        return None
+
+    return cgroup_path
+
+
+def enter_resource_limits(
+    cgroup_path: str | None, rlimits: list[tuple[int, tuple[int, int]]]
+) -> None:
+    if cgroup_path is not None:
+        write_cgroup_file(cgroup_path, "cgroup.procs", "0")
+
+    for rlimit, values in rlimits:
+        resource.setrlimit(rlimit, values)
+
+
+def get_preexec_fn(
+    cgroup_path: str | None, rlimits: list[tuple[int, tuple[int, int]]]
+) -> Callable[[], None] | None:
+    if cgroup_path is None and not rlimits:
+        return None
+
+    return functools.partial(enter_resource_limits, cgroup_path, rlimits)
+
+
+def get_limit_hit(
+    limits: dict[str, int],
+    cgroup_path: str | None,
+    return_code: int | None,
+    cpu_time: float,
+    error: str,
+) -> str | None:
+    if cgroup_path is not None:
+        if read_cgroup_events(cgroup_path, "memory.events").get("oom_kill", 0) > 0:
+            return "memory"
+
+        if read_cgroup_events(cgroup_path, "pids.events").get("max", 0) > 0:
+            return "processes"
+    elif "memory" in limits and error == "MemoryError":
+        return "memory"
+
+    if "cpu_time" in limits and (
+        return_code == -signal.SIGXCPU or cpu_time >= limits["cpu_time"]
+    ):
+        return "cpu_time"
+
+    return None
+
+
+def remove_cgroup(cgroup_path: str | None) -> None:
+    if cgroup_path is None:
+        return
+
+    try:
+        write_cgroup_file(cgroup_path, "cgroup.kill", "1")
+    except OSError:
+        pass
+
+    for _ in range(CGROUP_REMOVE_ATTEMPTS):
+        try:
+            os.rmdir(cgroup_path)
+            return
+        except FileNotFoundError:
+            return
+        except OSError:
+            time.sleep(0.1)
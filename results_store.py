@@ -0,0 +1,154 @@
+import sqlite3
+import json
+import os
+
+
+RESULTS_STORE_NAME = "results.sqlite"
+
+
+def open_results_store(results_path: str) -> sqlite3.Connection:
+    os.makedirs(results_path, exist_ok=True)
+
+    connection = sqlite3.connect(
+        os.path.join(results_path, RESULTS_STORE_NAME), timeout=60
+    )
+
+    connection.execute("PRAGMA journal_mode=DELETE")
+
+    with connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                experiment_name TEXT NOT NULL,
+                run_index INTEGER NOT NULL,
+                record TEXT NOT NULL,
+                PRIMARY KEY (experiment_name, run_index)
+            )
+            """
+        )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS executable_lines (
+                source_hash TEXT PRIMARY KEY,
+                lines TEXT NOT NULL
+            )
+            """
+        )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crashes (
+                experiment_name TEXT NOT NULL,
+                run_index INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                crash_site TEXT NOT NULL,
+                PRIMARY KEY (experiment_name, run_index, source)
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS crashes_signature ON crashes (signature)"
+        )
+
+    return connection
+
+
+def insert_run_record(
+    connection: sqlite3.Connection,
+    experiment_name: str,
+    run_index: int,
+    record: dict,
+) -> None:
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?)",
+            (experiment_name, run_index, json.dumps(record)),
+        )
+
+
+def delete_run_record(
+    connection: sqlite3.Connection, experiment_name: str, run_index: int
+) -> None:
+    with connection:
+        connection.execute(
+            "DELETE FROM runs WHERE experiment_name = ? AND run_index = ?",
+            (experiment_name, run_index),
+        )
+        connection.execute(
+            "DELETE FROM crashes WHERE experiment_name = ? AND run_index = ?",
+            (experiment_name, run_index),
+        )
+
+
+def get_run_records(
+    connection: sqlite3.Connection, experiment_name: str
+) -> dict[int, dict]:
+    return {
+        run_index: json.loads(record)
+        for run_index, record in connection.execute(
+            "SELECT run_index, record FROM runs WHERE experiment_name = ?",
+            (experiment_name,),
+        )
+    }
+
+
+def insert_executable_lines(
+    connection: sqlite3.Connection, source_hash: str, lines: list[int]
+) -> None:
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO executable_lines VALUES (?, ?)",
+            (source_hash, json.dumps(lines)),
+        )
+
+
+def get_executable_lines(
+    connection: sqlite3.Connection, source_hash: str
+) -> list[int] | None:
+    row = connection.execute(
+        "SELECT lines FROM executable_lines WHERE source_hash = ?", (source_hash,)
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    return json.loads(row[0])
+
+
+def insert_run_crashes(
+    connection: sqlite3.Connection,
+    experiment_name: str,
+    run_index: int,
+    crashes: list[dict],
+) -> None:
+    with connection:
+        connection.execute(
+            "DELETE FROM crashes WHERE experiment_name = ? AND run_index = ?",
+            (experiment_name, run_index),
+        )
+        connection.executemany(
+            "INSERT INTO crashes VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    experiment_name,
+                    run_index,
+                    crash["source"],
+                    crash["signature"],
+                    crash["kind"],
+                    crash["crash_site"],
+                )
+                for crash in crashes
+            ),
+        )
+
+
+def get_crash_index(connection: sqlite3.Connection) -> list[tuple]:
+    return connection.execute(
+        """
+        SELECT signature, kind, MIN(crash_site), experiment_name, COUNT(DISTINCT run_index)
+        FROM crashes
+        GROUP BY signature, experiment_name
+        ORDER BY signature, experiment_name
+        """
+    ).fetchall()
@@ -0,0 +1,142 @@
+from typing import BinaryIO, TextIO
+import threading
+import select
+import gzip
+import time
+import io
+import os
+
+
+LOG_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+PIPE_BUFFER_SIZE = 64 * 1024
+
+DRAIN_TIMEOUT = 5.0
+
+
+def open_log_writer(path: str, compression: str) -> BinaryIO:
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+
+    return open(path, "wb")
+
+
+class LogPipe:
+    def __init__(self, path: str, compression: str, max_size: int | None) -> None:
+        self.read_fd, self.write_fd = os.pipe()
+        self.deadline: float | None = None
+
+        self.thread = threading.Thread(
+            target=self.pump,
+            args=(open_log_writer(path, compression), max_size),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def fileno(self) -> int:
+        return self.write_fd
+
+    def pump(self, log_file: BinaryIO, max_size: int | None) -> None:
+        head_size = None if max_size is None else max_size // 2
+        tail_size = None if max_size is None else max_size - head_size
+
+        written_size = 0
+        truncated_size = 0
+        tail = bytearray()
+
+        with log_file:
+            while self.deadline is None or time.monotonic() < self.deadline:
+                ready, _, _ = select.select([self.read_fd], [], [], 0.1)
+
+                if not ready:
+                    continue
+
+                data = os.read(self.read_fd, PIPE_BUFFER_SIZE)
+
+                if not data:
+                    break
+
+                if max_size is None:
+                    log_file.write(data)
+                    continue
+
+                if written_size < head_size:
+                    head = data[: head_size - written_size]
+                    log_file.write(head)
+                    written_size += len(head)
+                    data = data[len(head) :]
+
+                tail += data
+
+                if len(tail) > tail_size:
+                    truncated_size += len(tail) - tail_size
+                    del tail[: len(tail) - tail_size]
+
+            if truncated_size > 0:
+                log_file.write(
+                    f"\n[... {truncated_size} bytes truncated ...]\n".encode()
+                )
+
+            log_file.write(tail)
+
+    def close(self) -> None:
+        os.close(self.write_fd)
+
+        self.deadline = time.monotonic() + DRAIN_TIMEOUT
+        self.thread.join()
+
+        os.close(self.read_fd)
+
+    def __enter__(self) -> "LogPipe":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def create_log(
+    run_path: str, name: str, compression: str, max_size: int | None
+) -> TextIO | LogPipe:
+    if compression == "none" and max_size is None:
+        return open(os.path.join(run_path, name), "w")
+
+    return LogPipe(
+        os.path.join(run_path, f"{name}{LOG_EXTENSIONS[compression]}"),
+        compression,
+        max_size,
+    )
+
+
+def find_log_path(run_path: str, name: str) -> str | None:
+    for extension in LOG_EXTENSIONS.values():
+        path = os.path.join(run_path, f"{name}{extension}")
+
+        if os.path.exists(path):
+            return path
+
+    return None
+
+
+def open_log(run_path: str, name: str) -> TextIO:
+    path = find_log_path(run_path, name)
+
+    if path is None:
+        raise FileNotFoundError(os.path.join(run_path, name))
+
+    if path.endswith(LOG_EXTENSIONS["gzip"]):
+        return gzip.open(path, "rt", errors="replace")
+
+    if path.endswith(LOG_EXTENSIONS["zstd"]):
+        import zstandard
+
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True),
+            errors="replace",
+        )
+
+    return open(path, "r", errors="replace")
@@ -0,0 +1,84 @@
+from typing import Callable, NamedTuple
+import heapq
+
+
+NANOSECONDS_IN_SECOND = 1_000_000_000
+
+
+class RunEstimate(NamedTuple):
+    wall_time: float
+    peak_rss: int
+    nb_records: int
+
+
+def get_run_estimate(
+    records: list[dict],
+    default_wall_time: float,
+    default_peak_rss: int,
+    memory_limit: int | None,
+) -> RunEstimate:
+    wall_times = [
+        record["wall_time"] / NANOSECONDS_IN_SECOND
+        for record in records
+        if "wall_time" in record
+    ]
+    peak_rss = [record["peak_rss"] for record in records if "peak_rss" in record]
+
+    if wall_times:
+        wall_time = sum(wall_times) / len(wall_times)
+    else:
+        wall_time = default_wall_time
+
+    estimated_peak_rss = max(peak_rss, default=default_peak_rss)
+
+    if memory_limit is not None:
+        estimated_peak_rss = min(estimated_peak_rss, memory_limit)
+
+    return RunEstimate(wall_time, estimated_peak_rss, len(wall_times))
+
+
+def find_next_task(
+    pending: list,
+    get_peak_rss: Callable,
+    running_memory: int,
+    memory_budget: int | None,
+) -> int | None:
+    for i, task in enumerate(pending):
+        if (
+            memory_budget is None
+            or running_memory == 0
+            or running_memory + get_peak_rss(task) <= memory_budget
+        ):
+            return i
+
+    return None
+
+
+def simulate_schedule(
+    estimates: list[RunEstimate], jobs: int, memory_budget: int | None
+) -> float:
+    pending = sorted(estimates, key=lambda estimate: -estimate.wall_time)
+    running: list[tuple[float, int]] = []
+    running_memory = 0
+    current_time = 0.0
+    while pending:
+        if len(running) < jobs:
+            i = find_next_task(
+                pending,
+                lambda estimate: estimate.peak_rss,
+                running_memory,
+                memory_budget,
+            )
+        else:
+            i = None
+
+        if i is None:
+            current_time, peak_rss = heapq.heappop(running)
+            running_memory -= peak_rss
+            continue
+
+        estimate = pending.pop(i)
+        heapq.heappush(running, (current_time + estimate.wall_time, estimate.peak_rss))
+        running_memory += estimate.peak_rss
+
+    return max((end_time for end_time, _ in running), default=current_time)
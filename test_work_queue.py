@@ -0,0 +1,53 @@
+from work_queue import open_work_queue, enqueue_experiment, acquire_work_item
+from contextlib import closing
+from types import SimpleNamespace
+import experiment
+
+
+def lease_run(queue_path: str, owner: str) -> SimpleNamespace:
+    with closing(open_work_queue(queue_path)) as work_queue:
+        enqueue_experiment(work_queue, "expA", {}, [0])
+
+        assert acquire_work_item(work_queue, owner, 600) == ("expA", 0)
+
+    return SimpleNamespace(experiment_name="expA", index=0)
+
+
+def get_work_items(queue_path: str) -> list[tuple]:
+    with closing(open_work_queue(queue_path)) as work_queue:
+        return work_queue.execute(
+            "SELECT experiment_name, run_index, state, owner FROM work_items"
+        ).fetchall()
+
+
+def test_interrupted_leased_run_is_released(tmp_path, monkeypatch):
+    queue_path = str(tmp_path / "queue.sqlite")
+    run = lease_run(queue_path, "worker")
+
+    def interrupted_search_stage(run, cancel_event):
+        experiment.INTERRUPTED.set()
+        return -2
+
+    monkeypatch.setattr(experiment, "execute_search_stage", interrupted_search_stage)
+
+    try:
+        return_code = experiment.execute_leased_run(queue_path, "worker", 600, run)
+    finally:
+        experiment.INTERRUPTED.clear()
+
+    assert return_code is None
+    assert get_work_items(queue_path) == [("expA", 0, "pending", None)]
+
+
+def test_finished_leased_run_is_completed(tmp_path, monkeypatch):
+    queue_path = str(tmp_path / "queue.sqlite")
+    run = lease_run(queue_path, "worker")
+
+    monkeypatch.setattr(experiment, "execute_search_stage", lambda run, event: 0)
+    monkeypatch.setattr(experiment, "execute_coverage_stage", lambda *args: None)
+    monkeypatch.setattr(experiment, "execute_extraction_stage", lambda run: {})
+
+    return_code = experiment.execute_leased_run(queue_path, "worker", 600, run)
+
+    assert return_code == 0
+    assert get_work_items(queue_path) == [("expA", 0, "done", "worker")]
@@ -0,0 +1,56 @@
+from utils import load_summary, compare_distributions
+from utils import add_cache_arguments, configure_cache
+from coverage_timeline import COVERAGE_THRESHOLDS, load_coverage_timelines
+from coverage_timeline import get_coverage_aucs, get_times_to_coverage
+import numpy as np
+import argparse
+
+
+def get_timeline_metrics(experiment_path: str) -> dict[str, np.ndarray]:
+    summary = load_summary(experiment_path)
+
+    coverage_timelines = load_coverage_timelines(experiment_path)
+
+    timeline_metrics = {"Coverage AUC": get_coverage_aucs(coverage_timelines)}
+
+    for threshold in COVERAGE_THRESHOLDS:
+        timeline_metrics[f"Time to {threshold:.0%} coverage"] = get_times_to_coverage(
+            coverage_timelines, threshold, summary["timeline_interval"]
+        )
+
+    return timeline_metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("first_experiment")
+    parser.add_argument("second_experiment")
+
+    add_cache_arguments(parser)
+
+    args = parser.parse_args()
+
+    configure_cache(args)
+
+    first_metrics = get_timeline_metrics(args.first_experiment)
+    second_metrics = get_timeline_metrics(args.second_experiment)
+
+    for name, first_values in first_metrics.items():
+        second_values = second_metrics[name]
+
+        u_statistic, p_value, a12, difference = compare_distributions(
+            first_values, second_values
+        )
+
+        first_median = str(np.median(first_values))
+        second_median = str(np.median(second_values))
+
+        print(f"{name:<30}: {first_median:<35} {second_median:<35}")
+        print(
+            f"{'  Mann–Whitney U-test':<30}: {u_statistic:.2f} (pvalue: {p_value:.2f})"
+        )
+        print(f"{'  Vargha-Delaney A statistic':<30}: {difference} ({a12:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,167 @@
-from scipy.stats import mannwhitneyu
+from results_store import RESULTS_STORE_NAME, open_results_store, get_run_records
+from analysis_cache import ANALYSIS_CACHE_PATH, ANALYSIS_CACHE_MAX_SIZE
+from analysis_cache import open_analysis_cache, get_cache_entry, insert_cache_entry
+from analysis_cache import clear_analysis_cache
+from scipy.stats import mannwhitneyu, norm
+import numpy as np
+from contextlib import closing
+from typing import Any, Callable
+import functools
+import argparse
+import sqlite3
+import pickle
 import json
 import csv
 import os
 
 
-def load_summary(experiment_path: str) -> dict:
-    summary_path = os.path.join(experiment_path, "summary.json")
+CACHE_ENABLED = True
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--clear-cache", action="store_true")
+
+
+def configure_cache(args: argparse.Namespace) -> None:
+    global CACHE_ENABLED
+
+    if args.clear_cache and os.path.exists(ANALYSIS_CACHE_PATH):
+        with closing(open_analysis_cache(ANALYSIS_CACHE_PATH)) as cache:
+            clear_analysis_cache(cache)
+
+    CACHE_ENABLED = not args.no_cache
+
+
+@functools.cache
+def get_analysis_cache() -> sqlite3.Connection | None:
+    try:
+        return open_analysis_cache(ANALYSIS_CACHE_PATH)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def get_files_signature(paths: list[str]) -> str:
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+
+        signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+
+    return json.dumps(signature)
+
+
+def load_cached(
+    name: str, arguments: list, dependency_paths: list[str], load: Callable[[], Any]
+) -> Any:
+    cache = get_analysis_cache() if CACHE_ENABLED else None
+
+    if cache is None:
+        return load()
+
+    key = json.dumps([name, *arguments])
+    signature = get_files_signature(dependency_paths)
+
+    value = get_cache_entry(cache, key, signature)
+
+    if value is not None:
+        return pickle.loads(value)
+
+    result = load()
+
+    if get_files_signature(dependency_paths) == signature:
+        insert_cache_entry(
+            cache, key, signature, pickle.dumps(result), ANALYSIS_CACHE_MAX_SIZE
+        )
 
+    return result
+
+
+def read_summary(summary_path: str) -> dict:
     with open(summary_path, "r") as f:
         return json.load(f)
 
 
+def load_summary(experiment_path: str) -> dict:
+    summary_path = os.path.abspath(os.path.join(experiment_path, "summary.json"))
+
+    return load_cached(
+        "summary", [summary_path], [summary_path], lambda: read_summary(summary_path)
+    )
+
+
+def read_run_lines(run_path: str) -> tuple[list[int], list[int]]:
+    try:
+        with open(os.path.join(run_path, "coverage.json"), "r") as f:
+            (file_data,) = json.load(f)["files"].values()
+    except (FileNotFoundError, ValueError):
+        return [], []
+
+    return file_data["executed_lines"], file_data["missing_lines"]
+
+
+def rebuild_line_hits(experiment_path: str) -> tuple[np.ndarray, np.ndarray]:
+    runs_lines = [
+        read_run_lines(os.path.join(experiment_path, str(i)))
+        for i in range(load_summary(experiment_path)["nb_runs"])
+    ]
+
+    line_numbers = np.array(
+        sorted(
+            set().union(
+                *(executed_lines for executed_lines, _ in runs_lines),
+                *(missing_lines for _, missing_lines in runs_lines),
+            )
+        ),
+        dtype=np.int64,
+    )
+
+    line_hits = np.zeros((len(runs_lines), len(line_numbers)), dtype=np.bool_)
+    for i, (executed_lines, _) in enumerate(runs_lines):
+        line_hits[i, np.searchsorted(line_numbers, executed_lines)] = True
+
+    return line_numbers, line_hits
+
+
+def load_line_hits(experiment_path: str) -> tuple[np.ndarray, np.ndarray]:
+    line_numbers_path = os.path.join(experiment_path, "line_numbers.npy")
+    line_hits_path = os.path.join(experiment_path, "line_hits.npy")
+
+    if not os.path.exists(line_numbers_path) or not os.path.exists(line_hits_path):
+        return rebuild_line_hits(experiment_path)
+
+    line_numbers = np.load(line_numbers_path, mmap_mode="r")
+    line_hits = np.load(line_hits_path, mmap_mode="r")
+
+    return line_numbers, line_hits
+
+
+def align_line_hit_counts(
+    all_line_numbers: list[np.ndarray], all_line_hits: list[np.ndarray]
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    lines = np.unique(np.concatenate(all_line_numbers))
+
+    all_counts = [
+        align_line_hit_count(lines, line_numbers, line_hits)
+        for line_numbers, line_hits in zip(all_line_numbers, all_line_hits)
+    ]
+
+    return lines, all_counts
+
+
+def align_line_hit_count(
+    lines: np.ndarray, line_numbers: np.ndarray, line_hits: np.ndarray
+) -> np.ndarray:
+    counts = np.zeros(len(lines), dtype=np.int64)
+    counts[np.searchsorted(lines, line_numbers)] = line_hits.sum(axis=0)
+
+    return counts
+
+
 def compare_distributions(
     first_distribution: list[float],
     second_distribution: list[float],
@@ -23,23 +174,111 @@ def compare_distributions(
     n2 = len(second_distribution)
     a12 = u_statistic / (n1 * n2)
 
-    distance = abs(a12 - 0.5)
+    difference = str(get_differences(np.asarray(a12)))
+
+    return u_statistic, p_value, a12, difference
+
+
+def load_run_records(experiment_path: str) -> dict[int, dict]:
+    experiment_path = os.path.normpath(experiment_path)
+    results_path = os.path.dirname(experiment_path)
+
+    if not os.path.exists(os.path.join(results_path, RESULTS_STORE_NAME)):
+        return {}
+
+    with closing(open_results_store(results_path)) as results_store:
+        return get_run_records(results_store, os.path.basename(experiment_path))
+
+
+def get_differences(a12: np.ndarray) -> np.ndarray:
+    distance = np.abs(a12 - 0.5)
+
+    return np.select(
+        [distance < 0.06, distance < 0.14, distance < 0.21],
+        ["Negligible", "Small", "Medium"],
+        "Large",
+    )
+
+
+def compare_line_hit_counts(
+    first_counts: np.ndarray,
+    first_nb_runs: int,
+    second_counts: np.ndarray,
+    second_nb_runs: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    first_counts = np.asarray(first_counts, dtype=np.float64)
+    second_counts = np.asarray(second_counts, dtype=np.float64)
+
+    n1 = first_nb_runs
+    n2 = second_nb_runs
+    n = n1 + n2
+
+    u_statistic = first_counts * (n2 - second_counts) + 0.5 * (
+        first_counts * second_counts + (n1 - first_counts) * (n2 - second_counts)
+    )
+
+    hits = first_counts + second_counts
+    misses = n - hits
+    ties = (hits**3 - hits + misses**3 - misses) / (n * (n - 1))
+    sigma = np.sqrt(n1 * n2 / 12 * ((n + 1) - ties))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (np.abs(u_statistic - n1 * n2 / 2) - 0.5) / sigma
+
+    p_value = np.where(sigma > 0, np.clip(2 * norm.sf(z), 0, 1), 1.0)
+
+    a12 = u_statistic / (n1 * n2)
+
+    return u_statistic, p_value, a12, get_differences(a12)
+
+
+def adjust_p_values(p_values: np.ndarray, method: str) -> np.ndarray:
+    p_values = np.asarray(p_values, dtype=np.float64)
+    m = len(p_values)
+
+    if method == "none" or m == 0:
+        return p_values
 
-    if distance < 0.06:
-        difference = "Negligible"
-    elif distance < 0.14:
-        difference = "Small"
-    elif distance < 0.21:
-        difference = "Medium"
+    if method == "bonferroni":
+        return np.minimum(p_values * m, 1.0)
+
+    order = np.argsort(p_values)
+    sorted_p_values = p_values[order]
+
+    if method == "holm":
+        adjusted = np.maximum.accumulate(sorted_p_values * (m - np.arange(m)))
+    elif method == "benjamini-hochberg":
+        adjusted = np.minimum.accumulate(
+            (sorted_p_values * m / np.arange(1, m + 1))[::-1]
+        )[::-1]
     else:
-        difference = "Large"
+        raise ValueError(f'Unknown correction method "{method}"')
 
-    return u_statistic, p_value, a12, difference
+    adjusted_p_values = np.empty(m)
+    adjusted_p_values[order] = np.minimum(adjusted, 1.0)
 
+    return adjusted_p_values
 
-def get_coverages(experiment_path: str, nb_runs: int) -> list[float]:
-    coverages = []
+
+RUN_STATISTICS = (
+    ("coverage", "Coverage"),
+    ("mutation_score", "MutationScore"),
+    ("iterations", "AlgorithmIterations"),
+    ("total_time", "TotalTime"),
+    ("search_time", "SearchTime"),
+)
+
+
+def read_run_statistics(experiment_path: str, nb_runs: int) -> dict[str, np.ndarray]:
+    run_records = load_run_records(experiment_path)
+
+    run_statistics = {key: np.zeros(nb_runs) for key, _ in RUN_STATISTICS}
     for i in range(nb_runs):
+        if i in run_records:
+            for key, _ in RUN_STATISTICS:
+                run_statistics[key][i] = run_records[i][key]
+            continue
+
         run_path = os.path.join(experiment_path, str(i))
 
         statistics_path = os.path.join(run_path, "statistics.csv")
@@ -47,10 +286,36 @@ def get_coverages(experiment_path: str, nb_runs: int) -> list[float]:
         try:
             with open(statistics_path, "r") as f:
                 (statistics,) = csv.DictReader(f)
-            coverage = float(statistics["Coverage"])
         except FileNotFoundError:
-            coverage = 0.0
+            continue
+
+        for key, column in RUN_STATISTICS:
+            try:
+                run_statistics[key][i] = float(statistics[column])
+            except ValueError:
+                pass
+
+    return run_statistics
+
 
-        coverages.append(coverage)
+def get_run_statistics(experiment_path: str, nb_runs: int) -> dict[str, np.ndarray]:
+    experiment_path = os.path.abspath(experiment_path)
 
-    return coverages
+    dependency_paths = [
+        os.path.join(os.path.dirname(experiment_path), RESULTS_STORE_NAME),
+        *(
+            os.path.join(experiment_path, str(i), "statistics.csv")
+            for i in range(nb_runs)
+        ),
+    ]
+
+    return load_cached(
+        "run_statistics",
+        [experiment_path, nb_runs],
+        dependency_paths,
+        lambda: read_run_statistics(experiment_path, nb_runs),
+    )
+
+
+def get_coverages(experiment_path: str, nb_runs: int) -> list[float]:
+    return get_run_statistics(experiment_path, nb_runs)["coverage"].tolist()
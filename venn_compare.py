@@ -1,11 +1,13 @@
 from matplotlib_venn import venn2_unweighted
-from utils import load_summary
+from utils import load_summary, load_line_hits
+from utils import add_cache_arguments, configure_cache
 import matplotlib.pyplot as plt
 import argparse
 
 
-def executed_lines_set(executed_lines_counter: dict[str, int]) -> set[str]:
-    return set(key for key, value in executed_lines_counter.items() if value > 0)
+def executed_lines_set(experiment_path: str) -> set[int]:
+    line_numbers, line_hits = load_line_hits(experiment_path)
+    return set(line_numbers[line_hits.any(axis=0)].tolist())
 
 
 def main() -> None:
@@ -14,8 +16,12 @@ def main() -> None:
     parser.add_argument("first_experiment")
     parser.add_argument("second_experiment")
 
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
 
+    configure_cache(args)
+
     summaries = [
         load_summary(args.first_experiment),
         load_summary(args.second_experiment),
@@ -24,7 +30,8 @@ def main() -> None:
     experiment_names = " and ".join(summary["experiment_name"] for summary in summaries)
     executed_lines_names = [summary["experiment_name"] for summary in summaries]
     executed_lines_sets = [
-        executed_lines_set(summary["executed_lines_counter"]) for summary in summaries
+        executed_lines_set(args.first_experiment),
+        executed_lines_set(args.second_experiment),
     ]
 
     fig, ax = plt.subplots()
@@ -0,0 +1,151 @@
+import sqlite3
+import json
+import time
+
+
+def open_work_queue(queue_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(queue_path, timeout=600, isolation_level=None)
+
+    connection.execute("PRAGMA journal_mode=DELETE")
+
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS experiments (
+            experiment_name TEXT PRIMARY KEY,
+            experiment TEXT NOT NULL
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS work_items (
+            experiment_name TEXT NOT NULL,
+            run_index INTEGER NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',
+            owner TEXT,
+            lease_expiration REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (experiment_name, run_index)
+        )
+        """
+    )
+
+    return connection
+
+
+def enqueue_experiment(
+    connection: sqlite3.Connection,
+    experiment_name: str,
+    experiment: dict,
+    run_indexes: list[int],
+) -> None:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.execute(
+            "INSERT OR IGNORE INTO experiments VALUES (?, ?)",
+            (experiment_name, json.dumps(experiment)),
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO work_items (experiment_name, run_index) VALUES (?, ?)",
+            ((experiment_name, run_index) for run_index in run_indexes),
+        )
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def acquire_work_item(
+    connection: sqlite3.Connection, owner: str, lease_duration: float
+) -> tuple[str, int] | None:
+    now = time.time()
+
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        row = connection.execute(
+            """
+            SELECT experiment_name, run_index FROM work_items
+            WHERE state = 'pending' OR (state = 'leased' AND lease_expiration < ?)
+            ORDER BY rowid
+            LIMIT 1
+            """,
+            (now,),
+        ).fetchone()
+
+        if row is not None:
+            connection.execute(
+                """
+                UPDATE work_items
+                SET state = 'leased', owner = ?, lease_expiration = ?, attempts = attempts + 1
+                WHERE experiment_name = ? AND run_index = ?
+                """,
+                (owner, now + lease_duration, *row),
+            )
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+    if row is None:
+        return None
+
+    return row
+
+
+def renew_lease(
+    connection: sqlite3.Connection,
+    experiment_name: str,
+    run_index: int,
+    owner: str,
+    lease_duration: float,
+) -> bool:
+    cursor = connection.execute(
+        """
+        UPDATE work_items SET lease_expiration = ?
+        WHERE experiment_name = ? AND run_index = ? AND state = 'leased' AND owner = ?
+        """,
+        (time.time() + lease_duration, experiment_name, run_index, owner),
+    )
+
+    return cursor.rowcount == 1
+
+
+def complete_work_item(
+    connection: sqlite3.Connection, experiment_name: str, run_index: int, owner: str
+) -> None:
+    connection.execute(
+        """
+        UPDATE work_items SET state = 'done', lease_expiration = NULL
+        WHERE experiment_name = ? AND run_index = ? AND owner = ?
+        """,
+        (experiment_name, run_index, owner),
+    )
+
+
+def release_work_item(
+    connection: sqlite3.Connection, experiment_name: str, run_index: int, owner: str
+) -> None:
+    connection.execute(
+        """
+        UPDATE work_items SET state = 'pending', owner = NULL, lease_expiration = NULL
+        WHERE experiment_name = ? AND run_index = ? AND state = 'leased' AND owner = ?
+        """,
+        (experiment_name, run_index, owner),
+    )
+
+
+def count_remaining_work_items(connection: sqlite3.Connection) -> int:
+    (remaining,) = connection.execute(
+        "SELECT COUNT(*) FROM work_items WHERE state != 'done'"
+    ).fetchone()
+
+    return remaining
+
+
+def get_queued_experiments(connection: sqlite3.Connection) -> dict[str, dict]:
+    return {
+        experiment_name: json.loads(experiment)
+        for experiment_name, experiment in connection.execute(
+            "SELECT experiment_name, experiment FROM experiments"
+        )
+    }